@@ -2,7 +2,31 @@
 
 __version__ = "1.5.1"
 
-# Make Sandbox available at package level
-from .sandbox import Sandbox, AsyncSandbox, ConfigFile, Secret
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sandbox import AsyncSandbox, ConfigFile, Sandbox, Secret
 
 __all__ = ["Sandbox", "AsyncSandbox", "ConfigFile", "Secret"]
+
+# Subpackages that used to be imported eagerly through the sandbox package
+_SUBMODULES = ("api", "api_async", "sandbox")
+
+
+def __getattr__(name):
+    # Make Sandbox available at package level, importing the sandbox package
+    # (and the API clients behind it) only on first access
+    if name in __all__:
+        from . import sandbox
+
+        for attr in __all__:
+            globals()[attr] = getattr(sandbox, attr)
+        return globals()[name]
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
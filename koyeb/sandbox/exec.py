@@ -110,6 +110,7 @@ class SandboxExecutor:
             ```
         """
         start_time = time.time()
+        self.sandbox._clear_fs_caches()
 
         # Use streaming if callbacks are provided
         if on_stdout or on_stderr:
@@ -229,6 +230,7 @@ class AsyncSandboxExecutor(SandboxExecutor):
             ```
         """
         start_time = time.time()
+        self.sandbox._clear_fs_caches()
 
         # Use streaming if callbacks are provided
         if on_stdout or on_stderr:
@@ -5,15 +5,41 @@ Sync and async Python clients for interacting with the Sandbox Executor API.
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, Iterator, Optional
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import httpx
 
-from .utils import DEFAULT_HTTP_TIMEOUT, SandboxServiceError, SandboxTimeoutError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+from .utils import (
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_HTTP_TIMEOUT,
+    SandboxServiceError,
+    SandboxTimeoutError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,14 +73,82 @@ def _build_headers(conn_info: ConnectionInfo) -> Dict[str, str]:
     return headers
 
 
+def _dumps(payload: Any) -> bytes:
+    """
+    Serialize a request payload to JSON.
+
+    Uses orjson when installed (`pip install koyeb-sdk[orjson]`), which is
+    much faster on large file contents and produces bytes directly.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON response body, using orjson when installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _build_limits() -> httpx.Limits:
+    """Build the connection pool limits shared by the sync and async clients."""
+    return httpx.Limits(
+        max_connections=DEFAULT_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def _http2_enabled() -> bool:
+    """
+    Check whether the sandbox clients should negotiate HTTP/2.
+
+    HTTP/2 needs the optional h2 package (`pip install koyeb-sdk[http2]`) and
+    can be turned off with SANDBOX_HTTP2=0.
+    """
+    if os.getenv("SANDBOX_HTTP2", "1") == "0":
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def executor_error_message(error: Exception) -> Optional[str]:
+    """Return the executor's error message carried by an HTTP error response, if any."""
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    try:
+        body = _loads(error.response.content)
+    except (ValueError, httpx.ResponseNotRead):
+        return None
+    if isinstance(body, dict) and body.get("error"):
+        return str(body["error"])
+    return None
+
+
+def is_unsupported_endpoint_error(error: Exception) -> bool:
+    """Check whether an error means the executor does not implement an endpoint."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        if status_code == 404:
+            # A 404 carrying an executor error is a regular "not found"
+            return executor_error_message(error) is None
+        return status_code in (405, 501)
+    if isinstance(error, SandboxServiceError):
+        return error.status_code == 501
+    return False
+
+
 def _parse_sse_line(line: str) -> Optional[Dict[str, Any]]:
     """Parse a Server-Sent Events line into an event dict."""
     if not line or not line.startswith("data:"):
         return None
     data = line[5:].strip()
     try:
-        return json.loads(data)
-    except json.JSONDecodeError:
+        return _loads(data)
+    except ValueError:
         return {"error": f"Failed to parse event data: {data}"}
 
 
@@ -75,7 +169,12 @@ class SandboxClient:
         self.secret = conn_info.secret
         self.timeout = timeout
         self.headers = _build_headers(conn_info)
-        self._client = httpx.Client(headers=self.headers, trust_env=True)
+        self._client = httpx.Client(
+            headers=self.headers,
+            limits=_build_limits(),
+            http2=_http2_enabled(),
+            trust_env=True,
+        )
         self._closed = False
 
     def close(self) -> None:
@@ -127,6 +226,8 @@ class SandboxClient:
         # Set default timeout if not provided
         if "timeout" not in kwargs:
             kwargs["timeout"] = self.timeout
+        if "json" in kwargs:
+            kwargs["content"] = _dumps(kwargs.pop("json"))
 
         for attempt in range(max_retries + 1):
             try:
@@ -195,7 +296,7 @@ class SandboxClient:
             f"{self.base_url}/health", timeout=5
         )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def run(
         self,
@@ -229,7 +330,7 @@ class SandboxClient:
             json=payload,
             timeout=request_timeout,
         )
-        return response.json()
+        return _loads(response.content)
 
     def run_streaming(
         self,
@@ -282,7 +383,7 @@ class SandboxClient:
             with self._client.stream(
                 "POST",
                 f"{self.base_url}/run_streaming",
-                json=payload,
+                content=_dumps(payload),
                 timeout=request_timeout,
             ) as response:
                 if response.status_code >= 500:
@@ -316,7 +417,41 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/write_file", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    def append_file(self, path: str, content: str) -> Dict[str, Any]:
+        """
+        Append content to a file, creating it if it does not exist.
+
+        Args:
+            path: The file path to append to
+            content: The content to append
+
+        Returns:
+            Dict with success status and error if any
+        """
+        payload = {"path": path, "content": content}
+        response = self._request_with_retry(
+            "POST", f"{self.base_url}/append_file", json=payload
+        )
+        return _loads(response.content)
+
+    def write_files(self, files: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Write several files in a single request.
+
+        Args:
+            files: List of dicts, each with 'path' and 'content'
+
+        Returns:
+            Dict with success status, a top-level error if the whole batch
+            failed, and an 'errors' list of {path, error} for failed entries
+        """
+        payload = {"files": files}
+        response = self._request_with_retry(
+            "POST", f"{self.base_url}/write_files", json=payload
+        )
+        return _loads(response.content)
 
     def read_file(self, path: str) -> Dict[str, Any]:
         """
@@ -332,7 +467,114 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/read_file", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    def write_file_binary(self, path: str, data: bytes) -> Dict[str, Any]:
+        """
+        Write raw bytes to a file, without JSON or base64 encoding.
+
+        Args:
+            path: The file path to write to
+            data: The bytes to write
+
+        Returns:
+            Dict with success status and error if any
+        """
+        response = self._request_with_retry(
+            "POST",
+            f"{self.base_url}/upload_file",
+            params={"path": path},
+            content=data,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        return _loads(response.content)
+
+    def read_file_binary(self, path: str) -> bytes:
+        """
+        Read the raw bytes of a file, without JSON or base64 encoding.
+
+        Args:
+            path: The file path to read from
+
+        Returns:
+            The file content
+        """
+        payload = {"path": path}
+        response = self._request_with_retry(
+            "POST", f"{self.base_url}/download_file", json=payload
+        )
+        return response.content
+
+    def upload_file(self, path: str, content: Iterable[bytes]) -> Dict[str, Any]:
+        """
+        Stream content to a file without buffering it in memory.
+
+        Args:
+            path: The file path to write to
+            content: Chunks of content to write. Must be re-iterable (not a
+                generator) for the upload to be retried on 503 errors.
+
+        Returns:
+            Dict with success status and error if any
+        """
+        response = self._request_with_retry(
+            "POST",
+            f"{self.base_url}/upload_file",
+            params={"path": path},
+            content=content,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        return _loads(response.content)
+
+    def download_file(
+        self, path: str, max_retries: int = 3, initial_backoff: float = 1.0
+    ) -> Iterator[bytes]:
+        """
+        Stream the raw content of a file without buffering it in memory.
+
+        Args:
+            path: The file path to read from
+            max_retries: Maximum number of retry attempts on 503 errors
+            initial_backoff: Initial backoff time in seconds (doubles each retry)
+
+        Yields:
+            Chunks of the file content as stored in the sandbox
+
+        Raises:
+            httpx.HTTPStatusError: If the file cannot be read (the response body
+                is loaded, so the executor error can be inspected)
+        """
+        backoff = initial_backoff
+        try:
+            for attempt in range(max_retries + 1):
+                with self._client.stream(
+                    "POST",
+                    f"{self.base_url}/download_file",
+                    content=_dumps({"path": path}),
+                    timeout=self.timeout,
+                ) as response:
+                    # Nothing was yielded yet, so a 503 can be retried
+                    if response.status_code != 503 or attempt == max_retries:
+                        if response.status_code >= 400:
+                            response.read()
+                            if response.status_code >= 500:
+                                raise SandboxServiceError(
+                                    status_code=response.status_code,
+                                    message=response.text,
+                                )
+                            response.raise_for_status()
+                        for chunk in response.iter_bytes():
+                            yield chunk
+                        return
+                logger.debug(
+                    f"Received 503 error, retrying... (attempt {attempt + 1}/{max_retries + 1})"
+                )
+                time.sleep(backoff)
+                backoff *= 2
+        except httpx.TimeoutException as e:
+            raise SandboxTimeoutError(
+                f"Request timed out after {self.timeout}s"
+            ) from e
 
     def delete_file(self, path: str) -> Dict[str, Any]:
         """
@@ -348,7 +590,7 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/delete_file", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     def make_dir(self, path: str) -> Dict[str, Any]:
         """
@@ -364,7 +606,7 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/make_dir", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     def delete_dir(self, path: str) -> Dict[str, Any]:
         """
@@ -380,7 +622,42 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/delete_dir", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    def rename(self, old_path: str, new_path: str) -> Dict[str, Any]:
+        """
+        Rename or move a file or directory.
+
+        Args:
+            old_path: The current path
+            new_path: The new path
+
+        Returns:
+            Dict with success status and error if any
+        """
+        payload = {"old_path": old_path, "new_path": new_path}
+        response = self._request_with_retry(
+            "POST", f"{self.base_url}/rename", json=payload
+        )
+        return _loads(response.content)
+
+    def remove(self, path: str, recursive: bool = False) -> Dict[str, Any]:
+        """
+        Remove a file or directory.
+
+        Args:
+            path: The path to remove
+            recursive: Remove directories and their contents, ignoring missing
+                paths (like `rm -rf`)
+
+        Returns:
+            Dict with success status and error if any
+        """
+        payload = {"path": path, "recursive": recursive}
+        response = self._request_with_retry(
+            "POST", f"{self.base_url}/remove", json=payload
+        )
+        return _loads(response.content)
 
     def list_dir(self, path: str) -> Dict[str, Any]:
         """
@@ -396,7 +673,24 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/list_dir", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    def stat_batch(self, paths: List[str]) -> Dict[str, Any]:
+        """
+        Get the type of several paths in a single request.
+
+        Args:
+            paths: The paths to stat
+
+        Returns:
+            Dict with a 'stats' mapping of path to {exists, is_file, is_dir}
+            and error if any
+        """
+        payload = {"paths": paths}
+        response = self._request_with_retry(
+            "POST", f"{self.base_url}/stat_batch", json=payload
+        )
+        return _loads(response.content)
 
     def bind_port(self, port: int) -> Dict[str, Any]:
         """
@@ -420,7 +714,7 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/bind_port", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     def unbind_port(self, port: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -445,7 +739,7 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/unbind_port", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     def start_process(
         self, cmd: str, cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None
@@ -480,7 +774,7 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/start_process", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     def kill_process(self, process_id: str) -> Dict[str, Any]:
         """
@@ -506,7 +800,7 @@ class SandboxClient:
         response = self._request_with_retry(
             "POST", f"{self.base_url}/kill_process", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     def list_processes(self) -> Dict[str, Any]:
         """
@@ -536,7 +830,7 @@ class SandboxClient:
         response = self._request_with_retry(
             "GET", f"{self.base_url}/list_processes"
         )
-        return response.json()
+        return _loads(response.content)
 
 
 class AsyncSandboxClient:
@@ -556,7 +850,12 @@ class AsyncSandboxClient:
         self.secret = conn_info.secret
         self.timeout = timeout
         self.headers = _build_headers(conn_info)
-        self._client = httpx.AsyncClient(headers=self.headers, trust_env=True)
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            limits=_build_limits(),
+            http2=_http2_enabled(),
+            trust_env=True,
+        )
         self._closed = False
 
     async def close(self) -> None:
@@ -603,6 +902,8 @@ class AsyncSandboxClient:
         # Set default timeout if not provided
         if "timeout" not in kwargs:
             kwargs["timeout"] = self.timeout
+        if "json" in kwargs:
+            kwargs["content"] = _dumps(kwargs.pop("json"))
 
         for attempt in range(max_retries + 1):
             try:
@@ -671,7 +972,7 @@ class AsyncSandboxClient:
             f"{self.base_url}/health", timeout=5
         )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     async def run(
         self,
@@ -705,7 +1006,7 @@ class AsyncSandboxClient:
             json=payload,
             timeout=request_timeout,
         )
-        return response.json()
+        return _loads(response.content)
 
     async def run_streaming(
         self,
@@ -758,7 +1059,7 @@ class AsyncSandboxClient:
             async with self._client.stream(
                 "POST",
                 f"{self.base_url}/run_streaming",
-                json=payload,
+                content=_dumps(payload),
                 timeout=request_timeout,
             ) as response:
                 if response.status_code >= 500:
@@ -792,7 +1093,41 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/write_file", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    async def append_file(self, path: str, content: str) -> Dict[str, Any]:
+        """
+        Append content to a file, creating it if it does not exist.
+
+        Args:
+            path: The file path to append to
+            content: The content to append
+
+        Returns:
+            Dict with success status and error if any
+        """
+        payload = {"path": path, "content": content}
+        response = await self._request_with_retry(
+            "POST", f"{self.base_url}/append_file", json=payload
+        )
+        return _loads(response.content)
+
+    async def write_files(self, files: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Write several files in a single request.
+
+        Args:
+            files: List of dicts, each with 'path' and 'content'
+
+        Returns:
+            Dict with success status, a top-level error if the whole batch
+            failed, and an 'errors' list of {path, error} for failed entries
+        """
+        payload = {"files": files}
+        response = await self._request_with_retry(
+            "POST", f"{self.base_url}/write_files", json=payload
+        )
+        return _loads(response.content)
 
     async def read_file(self, path: str) -> Dict[str, Any]:
         """
@@ -808,7 +1143,116 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/read_file", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    async def write_file_binary(self, path: str, data: bytes) -> Dict[str, Any]:
+        """
+        Write raw bytes to a file, without JSON or base64 encoding.
+
+        Args:
+            path: The file path to write to
+            data: The bytes to write
+
+        Returns:
+            Dict with success status and error if any
+        """
+        response = await self._request_with_retry(
+            "POST",
+            f"{self.base_url}/upload_file",
+            params={"path": path},
+            content=data,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        return _loads(response.content)
+
+    async def read_file_binary(self, path: str) -> bytes:
+        """
+        Read the raw bytes of a file, without JSON or base64 encoding.
+
+        Args:
+            path: The file path to read from
+
+        Returns:
+            The file content
+        """
+        payload = {"path": path}
+        response = await self._request_with_retry(
+            "POST", f"{self.base_url}/download_file", json=payload
+        )
+        return response.content
+
+    async def upload_file(
+        self, path: str, content: AsyncIterable[bytes]
+    ) -> Dict[str, Any]:
+        """
+        Stream content to a file without buffering it in memory.
+
+        Args:
+            path: The file path to write to
+            content: Chunks of content to write. Must be re-iterable (not an
+                async generator) for the upload to be retried on 503 errors.
+
+        Returns:
+            Dict with success status and error if any
+        """
+        response = await self._request_with_retry(
+            "POST",
+            f"{self.base_url}/upload_file",
+            params={"path": path},
+            content=content,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        return _loads(response.content)
+
+    async def download_file(
+        self, path: str, max_retries: int = 3, initial_backoff: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the raw content of a file without buffering it in memory.
+
+        Args:
+            path: The file path to read from
+            max_retries: Maximum number of retry attempts on 503 errors
+            initial_backoff: Initial backoff time in seconds (doubles each retry)
+
+        Yields:
+            Chunks of the file content as stored in the sandbox
+
+        Raises:
+            httpx.HTTPStatusError: If the file cannot be read (the response body
+                is loaded, so the executor error can be inspected)
+        """
+        backoff = initial_backoff
+        try:
+            for attempt in range(max_retries + 1):
+                async with self._client.stream(
+                    "POST",
+                    f"{self.base_url}/download_file",
+                    content=_dumps({"path": path}),
+                    timeout=self.timeout,
+                ) as response:
+                    # Nothing was yielded yet, so a 503 can be retried
+                    if response.status_code != 503 or attempt == max_retries:
+                        if response.status_code >= 400:
+                            await response.aread()
+                            if response.status_code >= 500:
+                                raise SandboxServiceError(
+                                    status_code=response.status_code,
+                                    message=response.text,
+                                )
+                            response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            yield chunk
+                        return
+                logger.debug(
+                    f"Received 503 error, retrying... (attempt {attempt + 1}/{max_retries + 1})"
+                )
+                await asyncio.sleep(backoff)
+                backoff *= 2
+        except httpx.TimeoutException as e:
+            raise SandboxTimeoutError(
+                f"Request timed out after {self.timeout}s"
+            ) from e
 
     async def delete_file(self, path: str) -> Dict[str, Any]:
         """
@@ -824,7 +1268,7 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/delete_file", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     async def make_dir(self, path: str) -> Dict[str, Any]:
         """
@@ -840,7 +1284,7 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/make_dir", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     async def delete_dir(self, path: str) -> Dict[str, Any]:
         """
@@ -856,7 +1300,42 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/delete_dir", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    async def rename(self, old_path: str, new_path: str) -> Dict[str, Any]:
+        """
+        Rename or move a file or directory.
+
+        Args:
+            old_path: The current path
+            new_path: The new path
+
+        Returns:
+            Dict with success status and error if any
+        """
+        payload = {"old_path": old_path, "new_path": new_path}
+        response = await self._request_with_retry(
+            "POST", f"{self.base_url}/rename", json=payload
+        )
+        return _loads(response.content)
+
+    async def remove(self, path: str, recursive: bool = False) -> Dict[str, Any]:
+        """
+        Remove a file or directory.
+
+        Args:
+            path: The path to remove
+            recursive: Remove directories and their contents, ignoring missing
+                paths (like `rm -rf`)
+
+        Returns:
+            Dict with success status and error if any
+        """
+        payload = {"path": path, "recursive": recursive}
+        response = await self._request_with_retry(
+            "POST", f"{self.base_url}/remove", json=payload
+        )
+        return _loads(response.content)
 
     async def list_dir(self, path: str) -> Dict[str, Any]:
         """
@@ -872,7 +1351,24 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/list_dir", json=payload
         )
-        return response.json()
+        return _loads(response.content)
+
+    async def stat_batch(self, paths: List[str]) -> Dict[str, Any]:
+        """
+        Get the type of several paths in a single request.
+
+        Args:
+            paths: The paths to stat
+
+        Returns:
+            Dict with a 'stats' mapping of path to {exists, is_file, is_dir}
+            and error if any
+        """
+        payload = {"paths": paths}
+        response = await self._request_with_retry(
+            "POST", f"{self.base_url}/stat_batch", json=payload
+        )
+        return _loads(response.content)
 
     async def bind_port(self, port: int) -> Dict[str, Any]:
         """
@@ -896,7 +1392,7 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/bind_port", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     async def unbind_port(self, port: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -921,7 +1417,7 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/unbind_port", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     async def start_process(
         self, cmd: str, cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None
@@ -956,7 +1452,7 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/start_process", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     async def kill_process(self, process_id: str) -> Dict[str, Any]:
         """
@@ -982,7 +1478,7 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "POST", f"{self.base_url}/kill_process", json=payload
         )
-        return response.json()
+        return _loads(response.content)
 
     async def list_processes(self) -> Dict[str, Any]:
         """
@@ -1012,4 +1508,4 @@ class AsyncSandboxClient:
         response = await self._request_with_retry(
             "GET", f"{self.base_url}/list_processes"
         )
-        return response.json()
+        return _loads(response.content)
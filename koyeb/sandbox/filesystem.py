@@ -7,20 +7,52 @@ Using SandboxClient HTTP API
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import codecs
+import functools
+import inspect
 import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from .executor_client import AsyncSandboxClient, SandboxClient
+from .exec import AsyncSandboxExecutor, SandboxExecutor
+from .executor_client import (
+    AsyncSandboxClient,
+    SandboxClient,
+    executor_error_message,
+    is_unsupported_endpoint_error,
+)
 from .utils import (
+    FILE_TRANSFER_CHUNK_SIZE,
+    MAX_CONCURRENT_FILE_WRITES,
     SandboxError,
     SandboxServiceError,
     check_error_message,
+    classify_error,
     escape_shell_arg,
 )
 
 if TYPE_CHECKING:
-    from .exec import AsyncSandboxExecutor, SandboxExecutor
     from .sandbox import Sandbox
 
 
@@ -44,6 +76,440 @@ class FileInfo:
     encoding: str
 
 
+def _encode_content(content: Union[str, bytes], encoding: str) -> str:
+    """Convert file content to the string form sent to the executor API."""
+    if isinstance(content, bytes):
+        if encoding == "base64":
+            return binascii.b2a_base64(content, newline=False).decode("ascii")
+        if encoding == "binary":
+            return content.decode("utf-8")
+        return content.decode(encoding)
+    return content
+
+
+def _decode_content(content_str: str, encoding: str) -> Union[str, bytes]:
+    """Convert content returned by the executor API to the requested form."""
+    if encoding == "base64":
+        return base64.b64decode(content_str)
+    if encoding == "binary":
+        return content_str.encode("utf-8")
+    return content_str
+
+
+def _append_content(
+    existing: Union[str, bytes], content: Union[str, bytes]
+) -> Union[str, bytes]:
+    """Concatenate content to existing file content of the same type."""
+    if isinstance(existing, bytes) and isinstance(content, bytes):
+        return existing + content
+    if isinstance(existing, str) and isinstance(content, str):
+        return existing + content
+    raise TypeError("Cannot mix bytes and str content in append mode")
+
+
+def _is_binary_transfer(encoding: str) -> bool:
+    """
+    Check whether bytes written with encoding are stored as-is, so they can be
+    sent as raw bytes.
+
+    This holds for the "binary" encoding, and for UTF-8 since the executor
+    stores text as UTF-8.
+    """
+    if encoding == "base64":
+        return False
+    if encoding == "binary":
+        return True
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _build_write_files_entries(files: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Build the payload entries for a batch write request."""
+    return [
+        {
+            "path": file_info["path"],
+            "content": _encode_content(
+                file_info["content"], file_info.get("encoding", "utf-8")
+            ),
+        }
+        for file_info in files
+    ]
+
+
+def _group_files_by_path(
+    files: List[Dict[str, str]],
+) -> List[List[Dict[str, str]]]:
+    """
+    Group write_files entries by target path, keeping their order, so entries
+    for the same path can be written one after the other (last write wins).
+    """
+    groups: Dict[str, List[Dict[str, str]]] = {}
+    for file_info in files:
+        groups.setdefault(posixpath.normpath(file_info["path"]), []).append(file_info)
+    return list(groups.values())
+
+
+def _check_write_files_response(response: Dict[str, Any]) -> None:
+    """Raise SandboxFilesystemError if a batch write reported any failure."""
+    if response.get("error"):
+        raise SandboxFilesystemError(f"Failed to write files: {response['error']}")
+    errors = response.get("errors") or []
+    if errors:
+        details = "; ".join(
+            f"{entry.get('path')}: {entry.get('error', 'Unknown error')}"
+            for entry in errors
+        )
+        raise SandboxFilesystemError(
+            f"Failed to write {len(errors)} file(s): {details}"
+        )
+
+
+def _handle_endpoint_error(
+    sandbox: Sandbox,
+    endpoint: str,
+    error: Exception,
+    action: str,
+    path: Optional[str] = None,
+) -> None:
+    """
+    Re-raise an error from an optional executor endpoint.
+
+    If the executor does not implement the endpoint, record it on the sandbox
+    and return so the caller can use its fallback instead. If path is given,
+    "no such file" errors are raised as SandboxFileNotFoundError.
+    """
+    if is_unsupported_endpoint_error(error):
+        sandbox._unsupported_endpoints.add(endpoint)
+        return
+    if isinstance(error, SandboxError):
+        raise error
+    error_msg = executor_error_message(error) or str(error)
+    if path is not None and check_error_message(error_msg, "NO_SUCH_FILE"):
+        raise SandboxFileNotFoundError(f"File not found: {path}") from error
+    raise SandboxFilesystemError(f"Failed to {action}: {error_msg}") from error
+
+
+class _ExecutorResponseError(Exception):
+    """Error reported in the body of an executor response."""
+
+
+def _check_response(response: Dict[str, Any]) -> None:
+    """Raise _ExecutorResponseError if an executor response reports an error."""
+    if response.get("error"):
+        raise _ExecutorResponseError(response["error"])
+
+
+# Error types (see classify_error) mapped to the exception raised for them
+_ErrorMap = Dict[str, Tuple[Type[SandboxFilesystemError], str]]
+
+_FILE_ERRORS: _ErrorMap = {
+    "NO_SUCH_FILE": (SandboxFileNotFoundError, "File not found"),
+}
+_DIR_ERRORS: _ErrorMap = {
+    "NO_SUCH_FILE": (SandboxFileNotFoundError, "Directory not found"),
+    "DIR_NOT_EMPTY": (SandboxFilesystemError, "Directory not empty"),
+}
+_MKDIR_ERRORS: _ErrorMap = {
+    "FILE_EXISTS": (SandboxFileExistsError, "Directory already exists"),
+}
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _api_call(
+    action: str, error_map: Optional[_ErrorMap] = None
+) -> Callable[[_F], _F]:
+    """
+    Decorate a filesystem method taking the path as first argument so errors
+    are raised as SandboxFilesystemError (or the subclass from error_map).
+
+    SandboxServiceError and SandboxFilesystemError propagate unchanged, as do
+    UnicodeError and LookupError from encoding content locally; the error
+    message of anything else is classified once and looked up in error_map.
+    """
+    error_map = error_map or {}
+    passthrough = (SandboxServiceError, SandboxFilesystemError, UnicodeError)
+
+    def is_passthrough(error: Exception) -> bool:
+        # Unknown codecs raise LookupError itself; subclasses such as KeyError
+        # are not encoding errors
+        return isinstance(error, passthrough) or type(error) is LookupError
+
+    def raise_error(
+        error: Exception, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> NoReturn:
+        error_msg = str(error)
+        path = kwargs.get("path", args[0] if args else ".")
+        # Errors reported in a response body are not chained to the internal one
+        cause = None if isinstance(error, _ExecutorResponseError) else error
+        tag = classify_error(error_msg, error_map)
+        if tag in error_map:
+            error_class, label = error_map[tag]
+            raise error_class(f"{label}: {path}") from cause
+        raise SandboxFilesystemError(f"Failed to {action}: {error_msg}") from cause
+
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(self, *args, **kwargs)
+                except Exception as e:
+                    if is_passthrough(e):
+                        raise
+                    raise_error(e, args, kwargs)
+
+            return cast(_F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                if is_passthrough(e):
+                    raise
+                raise_error(e, args, kwargs)
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
+def _parse_stat_batch_response(
+    paths: List[str], response: Dict[str, Any]
+) -> Dict[str, Dict[str, bool]]:
+    """Convert a stat_batch response into {path: {exists, is_file, is_dir}}."""
+    if response.get("error"):
+        raise SandboxFilesystemError(f"Failed to stat paths: {response['error']}")
+    stats = response.get("stats") or {}
+    result = {}
+    for path in paths:
+        entry = stats.get(path) or {}
+        result[path] = {
+            "exists": bool(entry.get("exists", False)),
+            "is_file": bool(entry.get("is_file", False)),
+            "is_dir": bool(entry.get("is_dir", False)),
+        }
+    return result
+
+
+def _parent_paths(path: str) -> Iterator[str]:
+    """Yield the parent directories of path, from the closest to the root."""
+    parent = posixpath.dirname(posixpath.normpath(path))
+    while True:
+        yield parent
+        grandparent = posixpath.dirname(parent)
+        if grandparent == parent:
+            return
+        parent = grandparent
+
+
+def _stat_command(paths: List[str]) -> str:
+    """Build a shell command printing one type letter (d/f/e/n) per path."""
+    escaped = " ".join(escape_shell_arg(path) for path in paths)
+    return (
+        f"for p in {escaped}; do "
+        'if [ -d "$p" ]; then echo d; elif [ -f "$p" ]; then echo f; '
+        'elif [ -e "$p" ]; then echo e; else echo n; fi; done'
+    )
+
+
+def _parse_stat_output(paths: List[str], stdout: str) -> Dict[str, Dict[str, bool]]:
+    """Convert the output of _stat_command into {path: {exists, is_file, is_dir}}."""
+    kinds = stdout.split()
+    if len(kinds) != len(paths):
+        raise SandboxFilesystemError(
+            f"Failed to stat paths: unexpected output {stdout!r}"
+        )
+    return {
+        path: {"exists": kind != "n", "is_file": kind == "f", "is_dir": kind == "d"}
+        for path, kind in zip(paths, kinds)
+    }
+
+
+class _ChunkEncoder:
+    """
+    Incrementally convert local file bytes to the content stored by the executor:
+    unchanged for "binary", base64 text for "base64", UTF-8 text otherwise.
+    """
+
+    def __init__(self, encoding: str) -> None:
+        self._binary = encoding == "binary"
+        self._carry = b""
+        self._decoder = (
+            None
+            if encoding in ("base64", "binary")
+            else codecs.getincrementaldecoder(encoding)()
+        )
+        # Reading whole 3-byte groups lets base64 chunks be encoded in place
+        self.chunk_size = (
+            FILE_TRANSFER_CHUNK_SIZE - FILE_TRANSFER_CHUNK_SIZE % 3
+            if encoding == "base64"
+            else FILE_TRANSFER_CHUNK_SIZE
+        )
+
+    def encode(self, chunk: bytes, final: bool = False) -> bytes:
+        if self._binary:
+            return chunk
+        if self._decoder is not None:
+            return self._decoder.decode(chunk, final).encode("utf-8")
+        data = memoryview(self._carry + chunk if self._carry else chunk)
+        # Only encode whole 3-byte groups so no padding ends up mid-stream
+        end = len(data) if final else len(data) - len(data) % 3
+        self._carry = bytes(data[end:])
+        return binascii.b2a_base64(data[:end], newline=False)
+
+
+class _ChunkDecoder:
+    """Incrementally convert content streamed by the executor back to local bytes."""
+
+    def __init__(self, encoding: str) -> None:
+        self._encoding = encoding
+        self._binary = encoding == "binary"
+        self._carry = b""
+        self._decoder = (
+            None
+            if encoding in ("base64", "binary")
+            else codecs.getincrementaldecoder("utf-8")(errors="replace")
+        )
+
+    def decode(self, chunk: bytes, final: bool = False) -> bytes:
+        if self._binary:
+            return chunk
+        if self._decoder is not None:
+            return self._decoder.decode(chunk, final).encode(self._encoding)
+        data = self._carry + b"".join(chunk.split())
+        # Only decode whole 4-character groups
+        end = len(data) if final else len(data) - len(data) % 4
+        self._carry = data[end:]
+        return base64.b64decode(data[:end])
+
+
+def _check_encoding(encoding: str) -> None:
+    """Raise LookupError for an unknown text encoding, before a transfer starts."""
+    if encoding not in ("base64", "binary"):
+        codecs.lookup(encoding)
+
+
+def _check_local_file_decodes(file_obj: BinaryIO, encoding: str) -> None:
+    """
+    Decode a local text file once before it is streamed.
+
+    A decoding error in the middle of a streamed upload would abort a request
+    whose body was partly sent; checking first leaves the remote file untouched.
+    """
+    if encoding in ("base64", "binary"):
+        return
+    decoder = codecs.getincrementaldecoder(encoding)()
+    file_obj.seek(0)
+    while True:
+        chunk = file_obj.read(FILE_TRANSFER_CHUNK_SIZE)
+        decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            return
+
+
+class _UploadStream:
+    """
+    Request body streaming a local file in encoded chunks.
+
+    Iterating again rewinds the file, so a retried request resends everything.
+    """
+
+    def __init__(self, file_obj: BinaryIO, encoding: str) -> None:
+        self._file = file_obj
+        self._encoding = encoding
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._file.seek(0)
+        encoder = _ChunkEncoder(self._encoding)
+        while True:
+            chunk = self._file.read(encoder.chunk_size)
+            data = encoder.encode(chunk, final=not chunk)
+            if data:
+                yield data
+            if not chunk:
+                return
+
+
+class _AsyncUploadStream:
+    """Async counterpart of _UploadStream, reading the local file in a worker thread."""
+
+    def __init__(self, file_obj: BinaryIO, encoding: str) -> None:
+        self._file = file_obj
+        self._encoding = encoding
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        await asyncio.to_thread(self._file.seek, 0)
+        encoder = _ChunkEncoder(self._encoding)
+        while True:
+            chunk = await asyncio.to_thread(self._file.read, encoder.chunk_size)
+            data = encoder.encode(chunk, final=not chunk)
+            if data:
+                yield data
+            if not chunk:
+                return
+
+
+def _write_chunks_to_local_file(
+    chunks: Iterator[bytes], path: str, encoding: str
+) -> None:
+    """
+    Decode streamed file chunks into a local file.
+
+    The local file is only opened once the download has started, so a failed
+    request leaves an existing file untouched.
+    """
+    decoder = _ChunkDecoder(encoding)
+    f = None
+    try:
+        for chunk in chunks:
+            if f is None:
+                f = open(path, "wb")
+            f.write(decoder.decode(chunk))
+        if f is None:
+            f = open(path, "wb")
+        f.write(decoder.decode(b"", final=True))
+    finally:
+        if f is not None:
+            f.close()
+
+
+async def _awrite_chunks_to_local_file(
+    chunks: AsyncIterator[bytes], path: str, encoding: str
+) -> None:
+    """Async counterpart of _write_chunks_to_local_file, writing in a worker thread."""
+    decoder = _ChunkDecoder(encoding)
+    f = None
+    try:
+        async for chunk in chunks:
+            if f is None:
+                f = await asyncio.to_thread(open, path, "wb")
+            await asyncio.to_thread(f.write, decoder.decode(chunk))
+        if f is None:
+            f = await asyncio.to_thread(open, path, "wb")
+        await asyncio.to_thread(f.write, decoder.decode(b"", final=True))
+    finally:
+        if f is not None:
+            await asyncio.to_thread(f.close)
+
+
+def _read_local_file(path: str) -> bytes:
+    """Read a local file into memory."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_local_file(path: str, content: bytes) -> None:
+    """Write bytes to a local file."""
+    with open(path, "wb") as f:
+        f.write(content)
+
+
 class SandboxFilesystem:
     """
     Synchronous filesystem operations for Koyeb Sandbox instances.
@@ -54,20 +520,37 @@ class SandboxFilesystem:
 
     def __init__(self, sandbox: Sandbox) -> None:
         self.sandbox = sandbox
-        self._executor = None
 
-    def _get_client(self) -> SandboxClient:
-        """Get or create SandboxClient instance, shared with the sandbox"""
+    @functools.cached_property
+    def client(self) -> SandboxClient:
+        """SandboxClient instance, shared with the sandbox"""
         return self.sandbox._get_client()
 
-    def _get_executor(self) -> "SandboxExecutor":
-        """Get or create SandboxExecutor instance"""
-        if self._executor is None:
-            from .exec import SandboxExecutor
+    @functools.cached_property
+    def executor(self) -> SandboxExecutor:
+        """SandboxExecutor instance used for shell fallbacks"""
+        return SandboxExecutor(self.sandbox)
+
+    def _drop_cached_clients(self) -> None:
+        """Forget cached HTTP clients, once the sandbox has closed them."""
+        for name in ("client", "async_client"):
+            self.__dict__.pop(name, None)
 
-            self._executor = SandboxExecutor(self.sandbox)
-        return self._executor
+    def _invalidate(self, *paths: str) -> None:
+        """
+        Drop cached metadata for paths that were just modified.
 
+        Writes create missing parent directories, so the cached stats and
+        listings of every parent are dropped as well.
+        """
+        for path in paths:
+            self.sandbox._stat_cache.invalidate(path)
+            self.sandbox._list_dir_cache.invalidate(path)
+            for parent in _parent_paths(path):
+                self.sandbox._stat_cache.invalidate(parent, recursive=False)
+                self.sandbox._list_dir_cache.invalidate(parent, recursive=False)
+
+    @_api_call("write file")
     def write_file(
         self, path: str, content: Union[str, bytes], encoding: str = "utf-8"
     ) -> None:
@@ -77,67 +560,67 @@ class SandboxFilesystem:
         Args:
             path: Absolute path to the file
             content: Content to write (string or bytes)
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary data.
+            encoding: File encoding (default: "utf-8"). Use "binary" to send bytes
+                as-is, or "base64" to store binary data base64-encoded.
         """
-        import base64
-
-        client = self._get_client()
-
-        if isinstance(content, bytes):
-            if encoding == "base64":
-                content_str = base64.b64encode(content).decode("ascii")
+        client = self.client
+
+        # Bytes stored as-is skip the decode / JSON round-trip
+        if (
+            isinstance(content, bytes)
+            and _is_binary_transfer(encoding)
+            and "upload_file" not in self.sandbox._unsupported_endpoints
+        ):
+            if encoding != "binary":
+                # Reject bytes that are not valid UTF-8, like the JSON path does
+                content.decode("utf-8")
+            try:
+                response = client.write_file_binary(path, content)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "upload_file", e, "write file")
             else:
-                content_str = content.decode(encoding)
-        else:
-            content_str = content
+                self._invalidate(path)
+                _check_response(response)
+                return
 
-        try:
-            response = client.write_file(path, content_str)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                raise SandboxFilesystemError(f"Failed to write file: {error_msg}")
-        except (SandboxServiceError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            raise SandboxFilesystemError(f"Failed to write file: {str(e)}") from e
+        response = client.write_file(path, _encode_content(content, encoding))
+        self._invalidate(path)
+        _check_response(response)
 
+    @_api_call("read file", _FILE_ERRORS)
     def read_file(self, path: str, encoding: str = "utf-8") -> FileInfo:
         """
         Read a file from the sandbox synchronously.
 
         Args:
             path: Absolute path to the file
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary data,
-                      which will decode the base64 content and return bytes.
+            encoding: File encoding (default: "utf-8"). Use "binary" to get the raw
+                      bytes, or "base64" to decode base64-encoded content to bytes.
 
         Returns:
-            FileInfo: Object with content (str or bytes if base64) and encoding
+            FileInfo: Object with content (str, or bytes if binary/base64) and encoding
         """
-        import base64 as base64_module
+        client = self.client
 
-        client = self._get_client()
-
-        try:
-            response = client.read_file(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"File not found: {path}")
-                raise SandboxFilesystemError(f"Failed to read file: {error_msg}")
-            content_str = response.get("content", "")
-            if encoding == "base64":
-                content: Union[str, bytes] = base64_module.b64decode(content_str)
+        if (
+            encoding == "binary"
+            and "download_file" not in self.sandbox._unsupported_endpoints
+        ):
+            try:
+                content_bytes = client.read_file_binary(path)
+            except Exception as e:
+                _handle_endpoint_error(
+                    self.sandbox, "download_file", e, "read file", path
+                )
             else:
-                content = content_str
-            return FileInfo(content=content, encoding=encoding)
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {path}") from e
-            raise SandboxFilesystemError(f"Failed to read file: {error_msg}") from e
+                return FileInfo(content=content_bytes, encoding=encoding)
 
+        response = client.read_file(path)
+        _check_response(response)
+        content = _decode_content(response.get("content", ""), encoding)
+        return FileInfo(content=content, encoding=encoding)
+
+    @_api_call("create directory", _MKDIR_ERRORS)
     def mkdir(self, path: str) -> None:
         """
         Create a directory synchronously.
@@ -147,56 +630,41 @@ class SandboxFilesystem:
         Args:
             path: Absolute path to the directory
         """
-        client = self._get_client()
+        client = self.client
 
-        try:
-            response = client.make_dir(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "FILE_EXISTS"):
-                    raise SandboxFileExistsError(f"Directory already exists: {path}")
-                raise SandboxFilesystemError(f"Failed to create directory: {error_msg}")
-        except (SandboxServiceError, SandboxFileExistsError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "FILE_EXISTS"):
-                raise SandboxFileExistsError(f"Directory already exists: {path}") from e
-            raise SandboxFilesystemError(
-                f"Failed to create directory: {error_msg}"
-            ) from e
+        response = client.make_dir(path)
+        self._invalidate(path)
+        _check_response(response)
 
-    def list_dir(self, path: str = ".") -> List[str]:
+    @_api_call("list directory", _DIR_ERRORS)
+    def list_dir(self, path: str = ".", use_cache: bool = True) -> List[str]:
         """
         List contents of a directory synchronously.
 
+        Listings are cached briefly (see Sandbox.fs_cache_ttl) and invalidated
+        by filesystem operations that modify the directory.
+
         Args:
             path: Path to the directory (default: current directory)
+            use_cache: Return a recently cached listing if available (default: True)
 
         Returns:
             List[str]: Names of files and directories within the specified path.
         """
-        client = self._get_client()
+        if use_cache:
+            cached = self.sandbox._list_dir_cache.get(path)
+            if cached is not None:
+                return list(cached)
 
-        try:
-            response = client.list_dir(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"Directory not found: {path}")
-                raise SandboxFilesystemError(f"Failed to list directory: {error_msg}")
-            entries = response.get("entries", [])
-            return entries
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"Directory not found: {path}") from e
-            raise SandboxFilesystemError(
-                f"Failed to list directory: {error_msg}"
-            ) from e
+        client = self.client
+
+        response = client.list_dir(path)
+        _check_response(response)
+        entries = response.get("entries", [])
+        self.sandbox._list_dir_cache.set(path, list(entries))
+        return entries
 
+    @_api_call("delete file", _FILE_ERRORS)
     def delete_file(self, path: str) -> None:
         """
         Delete a file synchronously.
@@ -204,23 +672,13 @@ class SandboxFilesystem:
         Args:
             path: Absolute path to the file
         """
-        client = self._get_client()
+        client = self.client
 
-        try:
-            response = client.delete_file(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"File not found: {path}")
-                raise SandboxFilesystemError(f"Failed to delete file: {error_msg}")
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {path}") from e
-            raise SandboxFilesystemError(f"Failed to delete file: {error_msg}") from e
+        response = client.delete_file(path)
+        self._invalidate(path)
+        _check_response(response)
 
+    @_api_call("delete directory", _DIR_ERRORS)
     def delete_dir(self, path: str) -> None:
         """
         Delete a directory synchronously.
@@ -228,28 +686,39 @@ class SandboxFilesystem:
         Args:
             path: Absolute path to the directory
         """
-        client = self._get_client()
+        client = self.client
 
-        try:
-            response = client.delete_dir(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"Directory not found: {path}")
-                if check_error_message(error_msg, "DIR_NOT_EMPTY"):
-                    raise SandboxFilesystemError(f"Directory not empty: {path}")
-                raise SandboxFilesystemError(f"Failed to delete directory: {error_msg}")
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"Directory not found: {path}") from e
-            if check_error_message(error_msg, "DIR_NOT_EMPTY"):
-                raise SandboxFilesystemError(f"Directory not empty: {path}") from e
-            raise SandboxFilesystemError(
-                f"Failed to delete directory: {error_msg}"
-            ) from e
+        response = client.delete_dir(path)
+        self._invalidate(path)
+        _check_response(response)
+
+    def _move(self, source_path: str, destination_path: str, action: str) -> None:
+        """Move a path synchronously, via the executor API or `mv` as a fallback."""
+        if "rename" not in self.sandbox._unsupported_endpoints:
+            try:
+                response = self.client.rename(source_path, destination_path)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "rename", e, action, source_path)
+            else:
+                self._invalidate(source_path, destination_path)
+                if response.get("error"):
+                    error_msg = response.get("error", "Unknown error")
+                    if check_error_message(error_msg, "NO_SUCH_FILE"):
+                        raise SandboxFileNotFoundError(f"File not found: {source_path}")
+                    raise SandboxFilesystemError(f"Failed to {action}: {error_msg}")
+                return
+
+        # Properly escape paths to prevent shell injection
+        executor = self.executor
+        source_path_escaped = escape_shell_arg(source_path)
+        destination_path_escaped = escape_shell_arg(destination_path)
+        result = executor(f"mv {source_path_escaped} {destination_path_escaped}")
+        self._invalidate(source_path, destination_path)
+
+        if not result.success:
+            if check_error_message(result.stderr, "NO_SUCH_FILE"):
+                raise SandboxFileNotFoundError(f"File not found: {source_path}")
+            raise SandboxFilesystemError(f"Failed to {action}: {result.stderr}")
 
     def rename_file(self, old_path: str, new_path: str) -> None:
         """
@@ -259,17 +728,7 @@ class SandboxFilesystem:
             old_path: Current file path
             new_path: New file path
         """
-        # Use exec since there's no direct rename in SandboxClient
-        # Properly escape paths to prevent shell injection
-        executor = self._get_executor()
-        old_path_escaped = escape_shell_arg(old_path)
-        new_path_escaped = escape_shell_arg(new_path)
-        result = executor(f"mv {old_path_escaped} {new_path_escaped}")
-
-        if not result.success:
-            if check_error_message(result.stderr, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {old_path}")
-            raise SandboxFilesystemError(f"Failed to rename file: {result.stderr}")
+        self._move(old_path, new_path, "rename file")
 
     def move_file(self, source_path: str, destination_path: str) -> None:
         """
@@ -279,51 +738,139 @@ class SandboxFilesystem:
             source_path: Current file path
             destination_path: Destination path
         """
-        # Use exec since there's no direct move in SandboxClient
-        # Properly escape paths to prevent shell injection
-        executor = self._get_executor()
-        source_path_escaped = escape_shell_arg(source_path)
-        destination_path_escaped = escape_shell_arg(destination_path)
-        result = executor(f"mv {source_path_escaped} {destination_path_escaped}")
-
-        if not result.success:
-            if check_error_message(result.stderr, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {source_path}")
-            raise SandboxFilesystemError(f"Failed to move file: {result.stderr}")
+        self._move(source_path, destination_path, "move file")
 
     def write_files(self, files: List[Dict[str, str]]) -> None:
         """
         Write multiple files in a single operation synchronously.
 
+        All files are sent in one request. Executors that do not support batch
+        writes, and batches with "binary" entries (the batch endpoint only takes
+        text), fall back to one request per file: different paths are written
+        concurrently and entries for the same path in order, so the last one
+        wins. A failed write does not stop the others; once all writes are
+        done, the first error is raised.
+
         Args:
             files: List of dictionaries, each with 'path', 'content', and optional 'encoding'.
+
+        Raises:
+            SandboxFilesystemError: If any of the files could not be written
+        """
+        if "write_files" not in self.sandbox._unsupported_endpoints and not any(
+            file_info.get("encoding") == "binary" for file_info in files
+        ):
+            entries = _build_write_files_entries(files)
+            try:
+                response = self.client.write_files(entries)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "write_files", e, "write files")
+            else:
+                self._invalidate(*(file_info["path"] for file_info in files))
+                _check_write_files_response(response)
+                return
+
+        def write_group(group: List[Dict[str, str]]) -> None:
+            for file_info in group:
+                path = file_info["path"]
+                content = file_info["content"]
+                encoding = file_info.get("encoding", "utf-8")
+                SandboxFilesystem.write_file(self, path, content, encoding)
+
+        groups = _group_files_by_path(files)
+        if len(groups) <= 1:
+            for group in groups:
+                write_group(group)
+            return
+
+        # Fall back to one request per file, with a bounded number in flight
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_FILE_WRITES, len(groups))
+        ) as pool:
+            # Consume the results so the first failure is raised
+            list(pool.map(write_group, groups))
+
+    def _try_append_file(
+        self, path: str, content: Union[str, bytes], encoding: str
+    ) -> bool:
+        """
+        Append content to a file server-side synchronously.
+
+        Returns False without doing anything when the executor has no append
+        endpoint, for base64 content (base64 chunks cannot be concatenated), or
+        for binary content (the append endpoint only takes text); the caller
+        then has to rewrite the whole file.
+        """
+        if (
+            encoding in ("base64", "binary")
+            or "append_file" in self.sandbox._unsupported_endpoints
+        ):
+            return False
+
+        try:
+            response = self.client.append_file(
+                path, _encode_content(content, encoding)
+            )
+        except Exception as e:
+            _handle_endpoint_error(self.sandbox, "append_file", e, "append to file")
+            return False
+        self._invalidate(path)
+        if response.get("error"):
+            error_msg = response.get("error", "Unknown error")
+            raise SandboxFilesystemError(f"Failed to append to file: {error_msg}")
+        return True
+
+    def stat_batch(self, paths: List[str]) -> Dict[str, Dict[str, bool]]:
         """
-        for file_info in files:
-            path = file_info["path"]
-            content = file_info["content"]
-            encoding = file_info.get("encoding", "utf-8")
-            SandboxFilesystem.write_file(self, path, content, encoding)
+        Get the type of several paths in a single round-trip synchronously.
+
+        Args:
+            paths: Paths to check
 
-    def exists(self, path: str) -> bool:
+        Returns:
+            Dict mapping each path to a dict with 'exists', 'is_file' and 'is_dir' flags
+        """
+        if not paths:
+            return {}
+
+        stats = None
+        if "stat_batch" not in self.sandbox._unsupported_endpoints:
+            try:
+                response = self.client.stat_batch(paths)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "stat_batch", e, "stat paths")
+            else:
+                stats = _parse_stat_batch_response(paths, response)
+
+        if stats is None:
+            result = self.executor(_stat_command(paths))
+            if not result.success:
+                raise SandboxFilesystemError(f"Failed to stat paths: {result.stderr}")
+            stats = _parse_stat_output(paths, result.stdout)
+
+        for path, stat in stats.items():
+            self.sandbox._stat_cache.set(path, stat)
+        return stats
+
+    def _stat(self, path: str, use_cache: bool) -> Dict[str, bool]:
+        """Get the type of a single path, served from the cache when possible."""
+        if use_cache:
+            cached = self.sandbox._stat_cache.get(path)
+            if cached is not None:
+                return cached
+        return SandboxFilesystem.stat_batch(self, [path])[path]
+
+    def exists(self, path: str, use_cache: bool = True) -> bool:
         """Check if file/directory exists synchronously"""
-        executor = self._get_executor()
-        path_escaped = escape_shell_arg(path)
-        result = executor(f"test -e {path_escaped}")
-        return result.success
+        return self._stat(path, use_cache)["exists"]
 
-    def is_file(self, path: str) -> bool:
+    def is_file(self, path: str, use_cache: bool = True) -> bool:
         """Check if path is a file synchronously"""
-        executor = self._get_executor()
-        path_escaped = escape_shell_arg(path)
-        result = executor(f"test -f {path_escaped}")
-        return result.success
+        return self._stat(path, use_cache)["is_file"]
 
-    def is_dir(self, path: str) -> bool:
+    def is_dir(self, path: str, use_cache: bool = True) -> bool:
         """Check if path is a directory synchronously"""
-        executor = self._get_executor()
-        path_escaped = escape_shell_arg(path)
-        result = executor(f"test -d {path_escaped}")
-        return result.success
+        return self._stat(path, use_cache)["is_dir"]
 
     def upload_file(
         self, local_path: str, remote_path: str, encoding: str = "utf-8"
@@ -334,17 +881,37 @@ class SandboxFilesystem:
         Args:
             local_path: Path to the local file
             remote_path: Destination path in the sandbox
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary files.
+            encoding: File encoding (default: "utf-8"). Use "binary" or "base64" for
+                binary files.
 
         Raises:
             SandboxFileNotFoundError: If local file doesn't exist
             UnicodeDecodeError: If file cannot be decoded with specified encoding
+            LookupError: If the encoding is unknown
         """
         if not os.path.exists(local_path):
             raise SandboxFileNotFoundError(f"Local file not found: {local_path}")
+        _check_encoding(encoding)
+
+        if "upload_file" not in self.sandbox._unsupported_endpoints:
+            try:
+                with open(local_path, "rb") as f:
+                    _check_local_file_decodes(f, encoding)
+                    response = self.client.upload_file(
+                        remote_path, _UploadStream(f, encoding)
+                    )
+            except (OSError, UnicodeError):
+                raise
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "upload_file", e, "upload file")
+            else:
+                self._invalidate(remote_path)
+                if response.get("error"):
+                    error_msg = response.get("error", "Unknown error")
+                    raise SandboxFilesystemError(f"Failed to upload file: {error_msg}")
+                return
 
-        with open(local_path, "rb") as f:
-            content_bytes = f.read()
+        content_bytes = _read_local_file(local_path)
 
         SandboxFilesystem.write_file(self, remote_path, content_bytes, encoding=encoding)
 
@@ -357,11 +924,28 @@ class SandboxFilesystem:
         Args:
             remote_path: Path to the file in the sandbox
             local_path: Destination path on the local filesystem
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary files.
+            encoding: File encoding (default: "utf-8"). Use "binary" or "base64" for
+                binary files.
 
         Raises:
             SandboxFileNotFoundError: If remote file doesn't exist
+            LookupError: If the encoding is unknown
         """
+        _check_encoding(encoding)
+        if "download_file" not in self.sandbox._unsupported_endpoints:
+            try:
+                _write_chunks_to_local_file(
+                    self.client.download_file(remote_path), local_path, encoding
+                )
+            except (OSError, UnicodeError):
+                raise
+            except Exception as e:
+                _handle_endpoint_error(
+                    self.sandbox, "download_file", e, "download file", remote_path
+                )
+            else:
+                return
+
         file_info = SandboxFilesystem.read_file(self, remote_path, encoding=encoding)
 
         if isinstance(file_info.content, bytes):
@@ -369,20 +953,20 @@ class SandboxFilesystem:
         else:
             content_bytes = file_info.content.encode(encoding)
 
-        with open(local_path, "wb") as f:
-            f.write(content_bytes)
+        _write_local_file(local_path, content_bytes)
 
-    def ls(self, path: str = ".") -> List[str]:
+    def ls(self, path: str = ".", use_cache: bool = True) -> List[str]:
         """
         List directory contents synchronously.
 
         Args:
             path: Path to list
+            use_cache: Return a recently cached listing if available (default: True)
 
         Returns:
             List of file/directory names
         """
-        return SandboxFilesystem.list_dir(self, path)
+        return SandboxFilesystem.list_dir(self, path, use_cache)
 
     def rm(self, path: str, recursive: bool = False) -> None:
         """
@@ -392,13 +976,28 @@ class SandboxFilesystem:
             path: Path to remove
             recursive: Remove recursively
         """
-        executor = self._get_executor()
+        if "remove" not in self.sandbox._unsupported_endpoints:
+            try:
+                response = self.client.remove(path, recursive)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "remove", e, "remove", path)
+            else:
+                self._invalidate(path)
+                if response.get("error"):
+                    error_msg = response.get("error", "Unknown error")
+                    if check_error_message(error_msg, "NO_SUCH_FILE"):
+                        raise SandboxFileNotFoundError(f"File not found: {path}")
+                    raise SandboxFilesystemError(f"Failed to remove: {error_msg}")
+                return
+
+        executor = self.executor
         path_escaped = escape_shell_arg(path)
 
         if recursive:
             result = executor(f"rm -rf {path_escaped}")
         else:
             result = executor(f"rm {path_escaped}")
+        self._invalidate(path)
 
         if not result.success:
             if check_error_message(result.stderr, "NO_SUCH_FILE"):
@@ -428,18 +1027,17 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
     Uses native async I/O via AsyncSandboxClient.
     """
 
-    def _get_async_client(self) -> AsyncSandboxClient:
-        """Get AsyncSandboxClient instance from the sandbox."""
+    @functools.cached_property
+    def async_client(self) -> AsyncSandboxClient:
+        """AsyncSandboxClient instance, shared with the sandbox"""
         return self.sandbox._get_async_client()
 
-    def _get_async_executor(self) -> "AsyncSandboxExecutor":
-        """Get or create AsyncSandboxExecutor instance."""
-        if self._executor is None:
-            from .exec import AsyncSandboxExecutor
-
-            self._executor = AsyncSandboxExecutor(self.sandbox)
-        return self._executor
+    @functools.cached_property
+    def async_executor(self) -> AsyncSandboxExecutor:
+        """AsyncSandboxExecutor instance used for shell fallbacks"""
+        return AsyncSandboxExecutor(self.sandbox)
 
+    @_api_call("write file")
     async def write_file(
         self, path: str, content: Union[str, bytes], encoding: str = "utf-8"
     ) -> None:
@@ -449,67 +1047,67 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
         Args:
             path: Absolute path to the file
             content: Content to write (string or bytes)
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary data.
+            encoding: File encoding (default: "utf-8"). Use "binary" to send bytes
+                as-is, or "base64" to store binary data base64-encoded.
         """
-        import base64
-
-        client = self._get_async_client()
-
-        if isinstance(content, bytes):
-            if encoding == "base64":
-                content_str = base64.b64encode(content).decode("ascii")
+        client = self.async_client
+
+        # Bytes stored as-is skip the decode / JSON round-trip
+        if (
+            isinstance(content, bytes)
+            and _is_binary_transfer(encoding)
+            and "upload_file" not in self.sandbox._unsupported_endpoints
+        ):
+            if encoding != "binary":
+                # Reject bytes that are not valid UTF-8, like the JSON path does
+                content.decode("utf-8")
+            try:
+                response = await client.write_file_binary(path, content)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "upload_file", e, "write file")
             else:
-                content_str = content.decode(encoding)
-        else:
-            content_str = content
+                self._invalidate(path)
+                _check_response(response)
+                return
 
-        try:
-            response = await client.write_file(path, content_str)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                raise SandboxFilesystemError(f"Failed to write file: {error_msg}")
-        except (SandboxServiceError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            raise SandboxFilesystemError(f"Failed to write file: {str(e)}") from e
+        response = await client.write_file(path, _encode_content(content, encoding))
+        self._invalidate(path)
+        _check_response(response)
 
+    @_api_call("read file", _FILE_ERRORS)
     async def read_file(self, path: str, encoding: str = "utf-8") -> FileInfo:
         """
         Read a file from the sandbox asynchronously.
 
         Args:
             path: Absolute path to the file
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary data,
-                      which will decode the base64 content and return bytes.
+            encoding: File encoding (default: "utf-8"). Use "binary" to get the raw
+                      bytes, or "base64" to decode base64-encoded content to bytes.
 
         Returns:
-            FileInfo: Object with content (str or bytes if base64) and encoding
+            FileInfo: Object with content (str, or bytes if binary/base64) and encoding
         """
-        import base64 as base64_module
+        client = self.async_client
 
-        client = self._get_async_client()
-
-        try:
-            response = await client.read_file(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"File not found: {path}")
-                raise SandboxFilesystemError(f"Failed to read file: {error_msg}")
-            content_str = response.get("content", "")
-            if encoding == "base64":
-                content: Union[str, bytes] = base64_module.b64decode(content_str)
+        if (
+            encoding == "binary"
+            and "download_file" not in self.sandbox._unsupported_endpoints
+        ):
+            try:
+                content_bytes = await client.read_file_binary(path)
+            except Exception as e:
+                _handle_endpoint_error(
+                    self.sandbox, "download_file", e, "read file", path
+                )
             else:
-                content = content_str
-            return FileInfo(content=content, encoding=encoding)
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {path}") from e
-            raise SandboxFilesystemError(f"Failed to read file: {error_msg}") from e
+                return FileInfo(content=content_bytes, encoding=encoding)
 
+        response = await client.read_file(path)
+        _check_response(response)
+        content = _decode_content(response.get("content", ""), encoding)
+        return FileInfo(content=content, encoding=encoding)
+
+    @_api_call("create directory", _MKDIR_ERRORS)
     async def mkdir(self, path: str) -> None:
         """
         Create a directory asynchronously.
@@ -519,56 +1117,41 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
         Args:
             path: Absolute path to the directory
         """
-        client = self._get_async_client()
+        client = self.async_client
 
-        try:
-            response = await client.make_dir(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "FILE_EXISTS"):
-                    raise SandboxFileExistsError(f"Directory already exists: {path}")
-                raise SandboxFilesystemError(f"Failed to create directory: {error_msg}")
-        except (SandboxServiceError, SandboxFileExistsError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "FILE_EXISTS"):
-                raise SandboxFileExistsError(f"Directory already exists: {path}") from e
-            raise SandboxFilesystemError(
-                f"Failed to create directory: {error_msg}"
-            ) from e
+        response = await client.make_dir(path)
+        self._invalidate(path)
+        _check_response(response)
 
-    async def list_dir(self, path: str = ".") -> List[str]:
+    @_api_call("list directory", _DIR_ERRORS)
+    async def list_dir(self, path: str = ".", use_cache: bool = True) -> List[str]:
         """
         List contents of a directory asynchronously.
 
+        Listings are cached briefly (see Sandbox.fs_cache_ttl) and invalidated
+        by filesystem operations that modify the directory.
+
         Args:
             path: Path to the directory (default: current directory)
+            use_cache: Return a recently cached listing if available (default: True)
 
         Returns:
             List[str]: Names of files and directories within the specified path.
         """
-        client = self._get_async_client()
+        if use_cache:
+            cached = self.sandbox._list_dir_cache.get(path)
+            if cached is not None:
+                return list(cached)
 
-        try:
-            response = await client.list_dir(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"Directory not found: {path}")
-                raise SandboxFilesystemError(f"Failed to list directory: {error_msg}")
-            entries = response.get("entries", [])
-            return entries
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"Directory not found: {path}") from e
-            raise SandboxFilesystemError(
-                f"Failed to list directory: {error_msg}"
-            ) from e
+        client = self.async_client
+
+        response = await client.list_dir(path)
+        _check_response(response)
+        entries = response.get("entries", [])
+        self.sandbox._list_dir_cache.set(path, list(entries))
+        return entries
 
+    @_api_call("delete file", _FILE_ERRORS)
     async def delete_file(self, path: str) -> None:
         """
         Delete a file asynchronously.
@@ -576,23 +1159,13 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
         Args:
             path: Absolute path to the file
         """
-        client = self._get_async_client()
+        client = self.async_client
 
-        try:
-            response = await client.delete_file(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"File not found: {path}")
-                raise SandboxFilesystemError(f"Failed to delete file: {error_msg}")
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {path}") from e
-            raise SandboxFilesystemError(f"Failed to delete file: {error_msg}") from e
+        response = await client.delete_file(path)
+        self._invalidate(path)
+        _check_response(response)
 
+    @_api_call("delete directory", _DIR_ERRORS)
     async def delete_dir(self, path: str) -> None:
         """
         Delete a directory asynchronously.
@@ -600,28 +1173,41 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
         Args:
             path: Absolute path to the directory
         """
-        client = self._get_async_client()
+        client = self.async_client
 
-        try:
-            response = await client.delete_dir(path)
-            if response.get("error"):
-                error_msg = response.get("error", "Unknown error")
-                if check_error_message(error_msg, "NO_SUCH_FILE"):
-                    raise SandboxFileNotFoundError(f"Directory not found: {path}")
-                if check_error_message(error_msg, "DIR_NOT_EMPTY"):
-                    raise SandboxFilesystemError(f"Directory not empty: {path}")
-                raise SandboxFilesystemError(f"Failed to delete directory: {error_msg}")
-        except (SandboxServiceError, SandboxFileNotFoundError, SandboxFilesystemError):
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            if check_error_message(error_msg, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"Directory not found: {path}") from e
-            if check_error_message(error_msg, "DIR_NOT_EMPTY"):
-                raise SandboxFilesystemError(f"Directory not empty: {path}") from e
-            raise SandboxFilesystemError(
-                f"Failed to delete directory: {error_msg}"
-            ) from e
+        response = await client.delete_dir(path)
+        self._invalidate(path)
+        _check_response(response)
+
+    async def _move(self, source_path: str, destination_path: str, action: str) -> None:
+        """Move a path asynchronously, via the executor API or `mv` as a fallback."""
+        if "rename" not in self.sandbox._unsupported_endpoints:
+            try:
+                response = await self.async_client.rename(
+                    source_path, destination_path
+                )
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "rename", e, action, source_path)
+            else:
+                self._invalidate(source_path, destination_path)
+                if response.get("error"):
+                    error_msg = response.get("error", "Unknown error")
+                    if check_error_message(error_msg, "NO_SUCH_FILE"):
+                        raise SandboxFileNotFoundError(f"File not found: {source_path}")
+                    raise SandboxFilesystemError(f"Failed to {action}: {error_msg}")
+                return
+
+        # Properly escape paths to prevent shell injection
+        executor = self.async_executor
+        source_path_escaped = escape_shell_arg(source_path)
+        destination_path_escaped = escape_shell_arg(destination_path)
+        result = await executor(f"mv {source_path_escaped} {destination_path_escaped}")
+        self._invalidate(source_path, destination_path)
+
+        if not result.success:
+            if check_error_message(result.stderr, "NO_SUCH_FILE"):
+                raise SandboxFileNotFoundError(f"File not found: {source_path}")
+            raise SandboxFilesystemError(f"Failed to {action}: {result.stderr}")
 
     async def rename_file(self, old_path: str, new_path: str) -> None:
         """
@@ -631,15 +1217,7 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
             old_path: Current file path
             new_path: New file path
         """
-        executor = self._get_async_executor()
-        old_path_escaped = escape_shell_arg(old_path)
-        new_path_escaped = escape_shell_arg(new_path)
-        result = await executor(f"mv {old_path_escaped} {new_path_escaped}")
-
-        if not result.success:
-            if check_error_message(result.stderr, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {old_path}")
-            raise SandboxFilesystemError(f"Failed to rename file: {result.stderr}")
+        await self._move(old_path, new_path, "rename file")
 
     async def move_file(self, source_path: str, destination_path: str) -> None:
         """
@@ -649,49 +1227,138 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
             source_path: Current file path
             destination_path: Destination path
         """
-        executor = self._get_async_executor()
-        source_path_escaped = escape_shell_arg(source_path)
-        destination_path_escaped = escape_shell_arg(destination_path)
-        result = await executor(f"mv {source_path_escaped} {destination_path_escaped}")
-
-        if not result.success:
-            if check_error_message(result.stderr, "NO_SUCH_FILE"):
-                raise SandboxFileNotFoundError(f"File not found: {source_path}")
-            raise SandboxFilesystemError(f"Failed to move file: {result.stderr}")
+        await self._move(source_path, destination_path, "move file")
 
     async def write_files(self, files: List[Dict[str, str]]) -> None:
         """
         Write multiple files in a single operation asynchronously.
 
+        All files are sent in one request. Executors that do not support batch
+        writes, and batches with "binary" entries (the batch endpoint only takes
+        text), fall back to one request per file: different paths are written
+        concurrently and entries for the same path in order, so the last one
+        wins. A failed write does not stop the others; once all writes are
+        done, the first error is raised.
+
         Args:
             files: List of dictionaries, each with 'path', 'content', and optional 'encoding'.
+
+        Raises:
+            SandboxFilesystemError: If any of the files could not be written
         """
-        for file_info in files:
-            path = file_info["path"]
-            content = file_info["content"]
-            encoding = file_info.get("encoding", "utf-8")
-            await self.write_file(path, content, encoding)
+        if "write_files" not in self.sandbox._unsupported_endpoints and not any(
+            file_info.get("encoding") == "binary" for file_info in files
+        ):
+            entries = _build_write_files_entries(files)
+            try:
+                response = await self.async_client.write_files(entries)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "write_files", e, "write files")
+            else:
+                self._invalidate(*(file_info["path"] for file_info in files))
+                _check_write_files_response(response)
+                return
+
+        # Fall back to one request per file, with a bounded number in flight
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_WRITES)
+
+        async def write_group(group: List[Dict[str, str]]) -> None:
+            async with semaphore:
+                for file_info in group:
+                    path = file_info["path"]
+                    content = file_info["content"]
+                    encoding = file_info.get("encoding", "utf-8")
+                    await self.write_file(path, content, encoding)
+
+        results = await asyncio.gather(
+            *(write_group(group) for group in _group_files_by_path(files)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _try_append_file(
+        self, path: str, content: Union[str, bytes], encoding: str
+    ) -> bool:
+        """
+        Append content to a file server-side asynchronously.
 
-    async def exists(self, path: str) -> bool:
+        Returns False without doing anything when the executor has no append
+        endpoint, for base64 content (base64 chunks cannot be concatenated), or
+        for binary content (the append endpoint only takes text); the caller
+        then has to rewrite the whole file.
+        """
+        if (
+            encoding in ("base64", "binary")
+            or "append_file" in self.sandbox._unsupported_endpoints
+        ):
+            return False
+
+        try:
+            response = await self.async_client.append_file(
+                path, _encode_content(content, encoding)
+            )
+        except Exception as e:
+            _handle_endpoint_error(self.sandbox, "append_file", e, "append to file")
+            return False
+        self._invalidate(path)
+        if response.get("error"):
+            error_msg = response.get("error", "Unknown error")
+            raise SandboxFilesystemError(f"Failed to append to file: {error_msg}")
+        return True
+
+    async def stat_batch(self, paths: List[str]) -> Dict[str, Dict[str, bool]]:
+        """
+        Get the type of several paths in a single round-trip asynchronously.
+
+        Args:
+            paths: Paths to check
+
+        Returns:
+            Dict mapping each path to a dict with 'exists', 'is_file' and 'is_dir' flags
+        """
+        if not paths:
+            return {}
+
+        stats = None
+        if "stat_batch" not in self.sandbox._unsupported_endpoints:
+            try:
+                response = await self.async_client.stat_batch(paths)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "stat_batch", e, "stat paths")
+            else:
+                stats = _parse_stat_batch_response(paths, response)
+
+        if stats is None:
+            result = await self.async_executor(_stat_command(paths))
+            if not result.success:
+                raise SandboxFilesystemError(f"Failed to stat paths: {result.stderr}")
+            stats = _parse_stat_output(paths, result.stdout)
+
+        for path, stat in stats.items():
+            self.sandbox._stat_cache.set(path, stat)
+        return stats
+
+    async def _stat(self, path: str, use_cache: bool) -> Dict[str, bool]:
+        """Get the type of a single path, served from the cache when possible."""
+        if use_cache:
+            cached = self.sandbox._stat_cache.get(path)
+            if cached is not None:
+                return cached
+        return (await self.stat_batch([path]))[path]
+
+    async def exists(self, path: str, use_cache: bool = True) -> bool:
         """Check if file/directory exists asynchronously"""
-        executor = self._get_async_executor()
-        path_escaped = escape_shell_arg(path)
-        result = await executor(f"test -e {path_escaped}")
-        return result.success
+        return (await self._stat(path, use_cache))["exists"]
 
-    async def is_file(self, path: str) -> bool:
+    async def is_file(self, path: str, use_cache: bool = True) -> bool:
         """Check if path is a file asynchronously"""
-        executor = self._get_async_executor()
-        path_escaped = escape_shell_arg(path)
-        result = await executor(f"test -f {path_escaped}")
-        return result.success
+        return (await self._stat(path, use_cache))["is_file"]
 
-    async def is_dir(self, path: str) -> bool:
+    async def is_dir(self, path: str, use_cache: bool = True) -> bool:
         """Check if path is a directory asynchronously"""
-        executor = self._get_async_executor()
-        path_escaped = escape_shell_arg(path)
-        result = await executor(f"test -d {path_escaped}")
-        return result.success
+        return (await self._stat(path, use_cache))["is_dir"]
 
     async def upload_file(
         self, local_path: str, remote_path: str, encoding: str = "utf-8"
@@ -702,17 +1369,40 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
         Args:
             local_path: Path to the local file
             remote_path: Destination path in the sandbox
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary files.
+            encoding: File encoding (default: "utf-8"). Use "binary" or "base64" for
+                binary files.
 
         Raises:
             SandboxFileNotFoundError: If local file doesn't exist
             UnicodeDecodeError: If file cannot be decoded with specified encoding
+            LookupError: If the encoding is unknown
         """
-        if not os.path.exists(local_path):
+        # Local disk I/O is the only blocking part, keep it off the event loop
+        if not await asyncio.to_thread(os.path.exists, local_path):
             raise SandboxFileNotFoundError(f"Local file not found: {local_path}")
+        _check_encoding(encoding)
+
+        if "upload_file" not in self.sandbox._unsupported_endpoints:
+            f = await asyncio.to_thread(open, local_path, "rb")
+            try:
+                await asyncio.to_thread(_check_local_file_decodes, f, encoding)
+                response = await self.async_client.upload_file(
+                    remote_path, _AsyncUploadStream(f, encoding)
+                )
+            except (OSError, UnicodeError):
+                raise
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "upload_file", e, "upload file")
+            else:
+                self._invalidate(remote_path)
+                if response.get("error"):
+                    error_msg = response.get("error", "Unknown error")
+                    raise SandboxFilesystemError(f"Failed to upload file: {error_msg}")
+                return
+            finally:
+                await asyncio.to_thread(f.close)
 
-        with open(local_path, "rb") as f:
-            content_bytes = f.read()
+        content_bytes = await asyncio.to_thread(_read_local_file, local_path)
 
         await self.write_file(remote_path, content_bytes, encoding=encoding)
 
@@ -725,11 +1415,30 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
         Args:
             remote_path: Path to the file in the sandbox
             local_path: Destination path on the local filesystem
-            encoding: File encoding (default: "utf-8"). Use "base64" for binary files.
+            encoding: File encoding (default: "utf-8"). Use "binary" or "base64" for
+                binary files.
 
         Raises:
             SandboxFileNotFoundError: If remote file doesn't exist
+            LookupError: If the encoding is unknown
         """
+        _check_encoding(encoding)
+        if "download_file" not in self.sandbox._unsupported_endpoints:
+            try:
+                await _awrite_chunks_to_local_file(
+                    self.async_client.download_file(remote_path),
+                    local_path,
+                    encoding,
+                )
+            except (OSError, UnicodeError):
+                raise
+            except Exception as e:
+                _handle_endpoint_error(
+                    self.sandbox, "download_file", e, "download file", remote_path
+                )
+            else:
+                return
+
         file_info = await self.read_file(remote_path, encoding=encoding)
 
         if isinstance(file_info.content, bytes):
@@ -737,20 +1446,20 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
         else:
             content_bytes = file_info.content.encode(encoding)
 
-        with open(local_path, "wb") as f:
-            f.write(content_bytes)
+        await asyncio.to_thread(_write_local_file, local_path, content_bytes)
 
-    async def ls(self, path: str = ".") -> List[str]:
+    async def ls(self, path: str = ".", use_cache: bool = True) -> List[str]:
         """
         List directory contents asynchronously.
 
         Args:
             path: Path to list
+            use_cache: Return a recently cached listing if available (default: True)
 
         Returns:
             List of file/directory names
         """
-        return await self.list_dir(path)
+        return await self.list_dir(path, use_cache)
 
     async def rm(self, path: str, recursive: bool = False) -> None:
         """
@@ -760,13 +1469,28 @@ class AsyncSandboxFilesystem(SandboxFilesystem):
             path: Path to remove
             recursive: Remove recursively
         """
-        executor = self._get_async_executor()
+        if "remove" not in self.sandbox._unsupported_endpoints:
+            try:
+                response = await self.async_client.remove(path, recursive)
+            except Exception as e:
+                _handle_endpoint_error(self.sandbox, "remove", e, "remove", path)
+            else:
+                self._invalidate(path)
+                if response.get("error"):
+                    error_msg = response.get("error", "Unknown error")
+                    if check_error_message(error_msg, "NO_SUCH_FILE"):
+                        raise SandboxFileNotFoundError(f"File not found: {path}")
+                    raise SandboxFilesystemError(f"Failed to remove: {error_msg}")
+                return
+
+        executor = self.async_executor
         path_escaped = escape_shell_arg(path)
 
         if recursive:
             result = await executor(f"rm -rf {path_escaped}")
         else:
             result = await executor(f"rm {path_escaped}")
+        self._invalidate(path)
 
         if not result.success:
             if check_error_message(result.stderr, "NO_SUCH_FILE"):
@@ -805,6 +1529,8 @@ class SandboxFileIO:
         self.mode = mode
         self.encoding = encoding
         self._closed = False
+        # Content last written in append mode, to skip re-reading the file
+        self._cached_content: Optional[Union[str, bytes]] = None
 
     def read(self) -> Union[str, bytes]:
         """Read file content synchronously"""
@@ -826,22 +1552,30 @@ class SandboxFileIO:
             raise ValueError("File is closed")
 
         if "a" in self.mode:
-            try:
-                existing = self.filesystem.read_file(self.path, encoding=self.encoding)
-                if isinstance(existing.content, bytes) and isinstance(content, bytes):
-                    content = existing.content + content
-                elif isinstance(existing.content, str) and isinstance(content, str):
-                    content = existing.content + content
-                else:
-                    raise TypeError("Cannot mix bytes and str content in append mode")
-            except SandboxFileNotFoundError:
-                pass
+            if self.filesystem._try_append_file(
+                self.path, content, self.encoding
+            ):
+                self._cached_content = None
+                return
+            existing = self._cached_content
+            if existing is None:
+                try:
+                    existing = self.filesystem.read_file(
+                        self.path, encoding=self.encoding
+                    ).content
+                except SandboxFileNotFoundError:
+                    pass
+            if existing is not None:
+                content = _append_content(existing, content)
 
         self.filesystem.write_file(self.path, content, encoding=self.encoding)
+        if "a" in self.mode:
+            self._cached_content = content
 
     def close(self) -> None:
         """Close the file"""
         self._closed = True
+        self._cached_content = None
 
     def __enter__(self):
         return self
@@ -865,6 +1599,8 @@ class AsyncSandboxFileIO:
         self.mode = mode
         self.encoding = encoding
         self._closed = False
+        # Content last written in append mode, to skip re-reading the file
+        self._cached_content: Optional[Union[str, bytes]] = None
 
     async def read(self) -> Union[str, bytes]:
         """Read file content asynchronously"""
@@ -886,24 +1622,31 @@ class AsyncSandboxFileIO:
             raise ValueError("File is closed")
 
         if "a" in self.mode:
-            try:
-                existing = await self.filesystem.read_file(
-                    self.path, encoding=self.encoding
-                )
-                if isinstance(existing.content, bytes) and isinstance(content, bytes):
-                    content = existing.content + content
-                elif isinstance(existing.content, str) and isinstance(content, str):
-                    content = existing.content + content
-                else:
-                    raise TypeError("Cannot mix bytes and str content in append mode")
-            except SandboxFileNotFoundError:
-                pass
+            if await self.filesystem._try_append_file(
+                self.path, content, self.encoding
+            ):
+                self._cached_content = None
+                return
+            existing = self._cached_content
+            if existing is None:
+                try:
+                    file_info = await self.filesystem.read_file(
+                        self.path, encoding=self.encoding
+                    )
+                    existing = file_info.content
+                except SandboxFileNotFoundError:
+                    pass
+            if existing is not None:
+                content = _append_content(existing, content)
 
         await self.filesystem.write_file(self.path, content, encoding=self.encoding)
+        if "a" in self.mode:
+            self._cached_content = content
 
     def close(self) -> None:
         """Close the file"""
         self._closed = True
+        self._cached_content = None
 
     async def __aenter__(self):
         return self
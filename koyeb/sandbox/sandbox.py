@@ -11,7 +11,7 @@ import os
 import secrets
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from koyeb.api.api.deployments_api import DeploymentsApi
 from koyeb.api.exceptions import ApiException, NotFoundException
@@ -22,8 +22,10 @@ from koyeb.api.models.update_service import UpdateService
 
 from .executor_client import ConnectionInfo
 from .utils import (
+    DEFAULT_FS_CACHE_TTL,
     DEFAULT_INSTANCE_WAIT_TIMEOUT,
     DEFAULT_POLL_INTERVAL,
+    PathCache,
     SandboxDeploymentError,
     SandboxError,
     SandboxTimeoutError,
@@ -86,6 +88,7 @@ class Sandbox:
         sandbox_secret: Optional[str] = None,
         poll_interval: float = DEFAULT_POLL_INTERVAL,
         host: Optional[str] = None,
+        fs_cache_ttl: float = DEFAULT_FS_CACHE_TTL,
     ):
         self.sandbox_id = sandbox_id
         self.app_id = app_id
@@ -103,12 +106,34 @@ class Sandbox:
         self._deployment_id: Optional[str] = None
         self._executor = None
         self._filesystem = None
+        # Executor endpoints that returned "not implemented", so callers can
+        # go straight to their fallback instead of probing on every call
+        self._unsupported_endpoints: Set[str] = set()
+        # Short-lived filesystem metadata caches, keyed by path
+        self._stat_cache = PathCache(fs_cache_ttl)
+        self._list_dir_cache = PathCache(fs_cache_ttl)
 
     @property
     def id(self) -> str:
         """Get the service ID of the sandbox."""
         return self.service_id
 
+    @property
+    def fs_cache_ttl(self) -> float:
+        """Seconds directory listings and path types stay cached (0 disables caching)."""
+        return self._stat_cache.ttl
+
+    @fs_cache_ttl.setter
+    def fs_cache_ttl(self, ttl: float) -> None:
+        for cache in (self._stat_cache, self._list_dir_cache):
+            cache.ttl = ttl
+            cache.clear()
+
+    def _clear_fs_caches(self) -> None:
+        """Drop cached filesystem metadata, since a command may change any path."""
+        self._stat_cache.clear()
+        self._list_dir_cache.clear()
+
     @classmethod
     def create(
         cls,
@@ -589,6 +614,19 @@ class Sandbox:
         clients = get_api_clients(self.api_token, self.host)
         clients.apps.delete_app(self.app_id)
 
+    def close(self) -> None:
+        """
+        Close the HTTP connection pool shared by the filesystem and exec interfaces.
+
+        The sandbox itself keeps running; a new connection pool is opened on the
+        next operation.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._filesystem is not None:
+            self._filesystem._drop_cached_clients()
+
     def _get_url_and_header_from_metadata(self) -> Optional[Tuple[str, str]]:
         """
         Get the public url of the sandbox and the routing key to use to reach it.
@@ -938,6 +976,7 @@ class Sandbox:
             >>> process_id = sandbox.launch_process("python -u server.py")
             >>> print(f"Started process: {process_id}")
         """
+        self._clear_fs_caches()
         client = self._get_client()
         try:
             response = client.start_process(cmd, cwd, env)
@@ -1109,9 +1148,7 @@ class Sandbox:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit - automatically deletes the sandbox."""
         try:
-            # Clean up client if it exists
-            if self._client is not None:
-                self._client.close()
+            self.close()
             self.delete()
         except Exception as e:
             logger.warning(f"Error during sandbox cleanup: {e}")
@@ -1567,6 +1604,18 @@ class AsyncSandbox(Sandbox):
         clients = get_async_api_clients(self.api_token, self.host)
         await clients.apps.delete_app(self.app_id)
 
+    async def close(self) -> None:
+        """
+        Close the HTTP connection pools shared by the filesystem and exec interfaces.
+
+        The sandbox itself keeps running; new connection pools are opened on the
+        next operation.
+        """
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        super().close()
+
     async def is_healthy(self) -> bool:
         """Check if sandbox is healthy and ready for operations asynchronously."""
         if not await self._async_is_deployment_healthy():
@@ -1630,6 +1679,7 @@ class AsyncSandbox(Sandbox):
         self, cmd: str, cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None
     ) -> str:
         """Launch a background process in the sandbox asynchronously."""
+        self._clear_fs_caches()
         client = self._get_async_client()
         try:
             response = await client.start_process(cmd, cwd, env)
@@ -1731,11 +1781,7 @@ class AsyncSandbox(Sandbox):
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit - automatically deletes the sandbox."""
         try:
-            # Clean up clients if they exist
-            if self._async_client is not None:
-                await self._async_client.close()
-            if self._client is not None:
-                self._client.close()
+            await self.close()
             await self.delete()
         except Exception as e:
             logger.warning(f"Error during sandbox cleanup: {e}")
@@ -0,0 +1,540 @@
+import asyncio
+import base64
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import httpx
+
+from koyeb.sandbox.executor_client import is_unsupported_endpoint_error
+from koyeb.sandbox.filesystem import (
+    AsyncSandboxFilesystem,
+    SandboxFileExistsError,
+    SandboxFileNotFoundError,
+    SandboxFilesystem,
+    SandboxFilesystemError,
+    _ChunkDecoder,
+    _ChunkEncoder,
+)
+from koyeb.sandbox.sandbox import AsyncSandbox, Sandbox
+from koyeb.sandbox.utils import PathCache
+
+
+def make_filesystem():
+    """Build a SandboxFilesystem backed by a mocked executor client."""
+    sandbox = mock.Mock()
+    sandbox._unsupported_endpoints = set()
+    sandbox._stat_cache = PathCache(ttl=10)
+    sandbox._list_dir_cache = PathCache(ttl=10)
+    client = sandbox._get_client.return_value
+    client.make_dir.return_value = {"success": True}
+    client.write_file.return_value = {"success": True}
+    return SandboxFilesystem(sandbox), client
+
+
+def http_error(status_code, body=None):
+    """Build the error httpx raises for a response with status_code."""
+    request = httpx.Request("POST", "http://sandbox/endpoint")
+    response = httpx.Response(status_code, json=body, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def encode_in_chunks(data, encoding, size):
+    encoder = _ChunkEncoder(encoding)
+    chunks = [encoder.encode(data[i : i + size]) for i in range(0, len(data), size)]
+    return b"".join(chunks) + encoder.encode(b"", final=True)
+
+
+def decode_in_chunks(data, encoding, size):
+    decoder = _ChunkDecoder(encoding)
+    chunks = [decoder.decode(data[i : i + size]) for i in range(0, len(data), size)]
+    return b"".join(chunks) + decoder.decode(b"", final=True)
+
+
+class TestCacheInvalidation(unittest.TestCase):
+    """Tests for cached metadata being dropped by filesystem writes."""
+
+    def test_mkdir_invalidates_parent_stats(self):
+        fs, client = make_filesystem()
+        client.stat_batch.return_value = {"stats": {"/tmp/new": {"exists": False}}}
+        self.assertFalse(fs.exists("/tmp/new"))
+
+        fs.mkdir("/tmp/new/sub")
+
+        client.stat_batch.return_value = {
+            "stats": {"/tmp/new": {"exists": True, "is_dir": True}}
+        }
+        self.assertTrue(fs.exists("/tmp/new"))
+        self.assertEqual(client.stat_batch.call_count, 2)
+
+    def test_write_invalidates_ancestor_listings(self):
+        fs, client = make_filesystem()
+        client.list_dir.return_value = {"entries": ["existing"]}
+        self.assertEqual(fs.ls("/tmp"), ["existing"])
+
+        fs.write_file("/tmp/a/b/c.txt", "content")
+
+        client.list_dir.return_value = {"entries": ["a", "existing"]}
+        self.assertEqual(fs.ls("/tmp"), ["a", "existing"])
+        self.assertEqual(client.list_dir.call_count, 2)
+
+
+class TestCommandsClearCaches(unittest.TestCase):
+    """Tests for cached metadata being dropped when commands run."""
+
+    def make_sandbox(self, sandbox_class):
+        sandbox = sandbox_class("id", "app", "service", sandbox_secret="secret")
+        sandbox._stat_cache.set("/tmp/file", {"exists": False})
+        sandbox._list_dir_cache.set("/tmp", [])
+        return sandbox
+
+    def assert_cleared(self, sandbox):
+        self.assertIsNone(sandbox._stat_cache.get("/tmp/file"))
+        self.assertIsNone(sandbox._list_dir_cache.get("/tmp"))
+
+    def test_exec_clears_caches(self):
+        sandbox = self.make_sandbox(Sandbox)
+        sandbox._client = mock.Mock()
+        sandbox._client.run.return_value = {"stdout": "", "code": 0}
+        sandbox.exec("touch /tmp/file")
+        self.assert_cleared(sandbox)
+
+    def test_launch_process_clears_caches(self):
+        sandbox = self.make_sandbox(Sandbox)
+        sandbox._client = mock.Mock()
+        sandbox._client.start_process.return_value = {"id": "process-id"}
+        sandbox.launch_process("touch /tmp/file")
+        self.assert_cleared(sandbox)
+
+    def test_async_exec_clears_caches(self):
+        sandbox = self.make_sandbox(AsyncSandbox)
+        sandbox._async_client = mock.AsyncMock()
+        sandbox._async_client.run.return_value = {"stdout": "", "code": 0}
+        asyncio.run(sandbox.exec("touch /tmp/file"))
+        self.assert_cleared(sandbox)
+
+    def test_async_launch_process_clears_caches(self):
+        sandbox = self.make_sandbox(AsyncSandbox)
+        sandbox._async_client = mock.AsyncMock()
+        sandbox._async_client.start_process.return_value = {"id": "process-id"}
+        asyncio.run(sandbox.launch_process("touch /tmp/file"))
+        self.assert_cleared(sandbox)
+
+
+class TestErrorHandling(unittest.TestCase):
+    """Tests for how filesystem operations report errors."""
+
+    def test_local_encoding_errors_are_not_wrapped(self):
+        fs, client = make_filesystem()
+        with self.assertRaises(UnicodeDecodeError):
+            fs.write_file("/tmp/file", b"\xff", encoding="ascii")
+        with self.assertRaises(LookupError):
+            fs.write_file("/tmp/file", b"data", encoding="no-such-codec")
+        client.write_file.assert_not_called()
+
+    def test_lookup_error_subclasses_are_wrapped(self):
+        fs, client = make_filesystem()
+        client.read_file.side_effect = KeyError("content")
+        with self.assertRaisesRegex(SandboxFilesystemError, "Failed to read file"):
+            fs.read_file("/tmp/file")
+
+    def test_executor_errors_are_classified(self):
+        fs, client = make_filesystem()
+        client.read_file.return_value = {"error": "open: no such file or directory"}
+        with self.assertRaises(SandboxFileNotFoundError) as ctx:
+            fs.read_file("/tmp/missing")
+        self.assertEqual(str(ctx.exception), "File not found: /tmp/missing")
+
+        # Patterns of other error types in the path are ignored
+        client.read_file.return_value = {
+            "error": "open /tmp/exists/not found/a.txt: no such file or directory"
+        }
+        with self.assertRaises(SandboxFileNotFoundError):
+            fs.read_file("/tmp/exists/not found/a.txt")
+        client.make_dir.return_value = {
+            "error": "mkdir /tmp/not found: file exists"
+        }
+        with self.assertRaises(SandboxFileExistsError):
+            fs.mkdir("/tmp/not found")
+
+        client.write_file.return_value = {"error": "disk full"}
+        with self.assertRaisesRegex(SandboxFilesystemError, "Failed to write file"):
+            fs.write_file("/tmp/file", "data")
+
+
+class TestChunkCodecs(unittest.TestCase):
+    """Tests for the incremental encoders used to stream file transfers."""
+
+    TEXT = "héllo wörld, 日本語 and emoji 🎉 " * 7
+    CHUNK_SIZES = (1, 2, 3, 4, 5, 7, 64, 1000)
+
+    def test_base64_matches_whole_file_encoding(self):
+        for length in (0, 1, 2, 3, 4, 5, 97, 100):
+            data = os.urandom(length)
+            for size in self.CHUNK_SIZES:
+                self.assertEqual(
+                    encode_in_chunks(data, "base64", size), base64.b64encode(data)
+                )
+
+    def test_base64_round_trip(self):
+        for length in (0, 1, 2, 3, 4, 5, 97, 100):
+            data = os.urandom(length)
+            encoded = base64.b64encode(data)
+            for size in self.CHUNK_SIZES:
+                self.assertEqual(decode_in_chunks(encoded, "base64", size), data)
+
+    def test_base64_decoder_ignores_line_breaks(self):
+        data = os.urandom(100)
+        encoded = base64.encodebytes(data)
+        for size in self.CHUNK_SIZES:
+            self.assertEqual(decode_in_chunks(encoded, "base64", size), data)
+
+    def test_base64_reads_whole_byte_groups(self):
+        self.assertEqual(_ChunkEncoder("base64").chunk_size % 3, 0)
+
+    def test_utf8_multibyte_split_across_chunks(self):
+        data = self.TEXT.encode("utf-8")
+        for size in self.CHUNK_SIZES:
+            encoded = encode_in_chunks(data, "utf-8", size)
+            self.assertEqual(encoded, data)
+            self.assertEqual(decode_in_chunks(encoded, "utf-8", size), data)
+
+    def test_other_text_encoding_is_stored_as_utf8(self):
+        text = "ça coûte 5 £"
+        data = text.encode("latin-1")
+        for size in self.CHUNK_SIZES:
+            encoded = encode_in_chunks(data, "latin-1", size)
+            self.assertEqual(encoded, text.encode("utf-8"))
+            self.assertEqual(decode_in_chunks(encoded, "latin-1", size), data)
+
+    def test_invalid_utf8_raises(self):
+        with self.assertRaises(UnicodeDecodeError):
+            encode_in_chunks(b"ok\xff", "utf-8", 2)
+
+    def test_truncated_multibyte_raises_at_end(self):
+        with self.assertRaises(UnicodeDecodeError):
+            encode_in_chunks("é".encode("utf-8")[:1], "utf-8", 1)
+
+    def test_binary_is_unchanged(self):
+        data = os.urandom(100)
+        for size in self.CHUNK_SIZES:
+            self.assertEqual(encode_in_chunks(data, "binary", size), data)
+            self.assertEqual(decode_in_chunks(data, "binary", size), data)
+
+
+class TestFileTransfer(unittest.TestCase):
+    """Tests for streaming uploads and downloads."""
+
+    def test_undecodable_file_is_not_sent(self):
+        fs, client = make_filesystem()
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"valid text then \xff")
+        self.addCleanup(os.unlink, f.name)
+
+        with self.assertRaises(UnicodeDecodeError):
+            fs.upload_file(f.name, "/tmp/remote.txt")
+        client.upload_file.assert_not_called()
+        client.write_file.assert_not_called()
+
+    def test_unknown_encoding_raises_lookup_error(self):
+        fs, client = make_filesystem()
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"text")
+        self.addCleanup(os.unlink, f.name)
+
+        with self.assertRaises(LookupError):
+            fs.upload_file(f.name, "/tmp/remote.txt", encoding="no-such-codec")
+        with self.assertRaises(LookupError):
+            fs.download_file("/tmp/remote.txt", f.name, encoding="no-such-codec")
+        client.upload_file.assert_not_called()
+        client.download_file.assert_not_called()
+
+
+class TestBinaryContent(unittest.TestCase):
+    """Tests for bytes that are not valid UTF-8."""
+
+    def make_filesystem(self):
+        fs, client = make_filesystem()
+        client.write_file_binary.return_value = {"success": True}
+        client.read_file_binary.return_value = b"\xff"
+        return fs, client
+
+    def test_binary_is_uploaded_raw(self):
+        fs, client = self.make_filesystem()
+        fs.write_file("/tmp/a.bin", b"\xff\x01", encoding="binary")
+        client.write_file_binary.assert_called_once_with("/tmp/a.bin", b"\xff\x01")
+        client.write_file.assert_not_called()
+
+    def test_invalid_utf8_raises(self):
+        fs, client = self.make_filesystem()
+        with self.assertRaises(UnicodeDecodeError):
+            fs.write_file("/tmp/a.txt", b"\xff")
+        client.write_file_binary.assert_not_called()
+
+    def test_append_rewrites_file(self):
+        fs, client = self.make_filesystem()
+        with fs.open("/tmp/a.bin", "a", encoding="binary") as f:
+            f.write(b"\x01")
+        client.append_file.assert_not_called()
+        client.write_file_binary.assert_called_once_with("/tmp/a.bin", b"\xff\x01")
+
+    def test_write_files_skips_batch(self):
+        fs, client = self.make_filesystem()
+        fs.write_files(
+            [
+                {"path": "/tmp/a.txt", "content": "a"},
+                {"path": "/tmp/b.bin", "content": b"\xff", "encoding": "binary"},
+            ]
+        )
+        client.write_files.assert_not_called()
+        client.write_file.assert_called_once_with("/tmp/a.txt", "a")
+        client.write_file_binary.assert_called_once_with("/tmp/b.bin", b"\xff")
+
+
+class TestNativeEndpoints(unittest.TestCase):
+    """Tests for rename/remove endpoints and their shell fallbacks."""
+
+    def make_filesystem(self):
+        fs, client = make_filesystem()
+        client.rename.return_value = {"success": True}
+        client.remove.return_value = {"success": True}
+        fs.executor = mock.Mock()
+        fs.executor.return_value.success = True
+        return fs, client
+
+    def test_unsupported_endpoint_errors(self):
+        self.assertTrue(is_unsupported_endpoint_error(http_error(404)))
+        self.assertTrue(is_unsupported_endpoint_error(http_error(405)))
+        self.assertTrue(is_unsupported_endpoint_error(http_error(501)))
+        self.assertFalse(
+            is_unsupported_endpoint_error(
+                http_error(404, {"error": "no such file or directory"})
+            )
+        )
+        self.assertFalse(is_unsupported_endpoint_error(http_error(400)))
+
+    def test_rename_uses_endpoint(self):
+        fs, client = self.make_filesystem()
+        fs.rename_file("/tmp/a", "/tmp/b")
+        client.rename.assert_called_once_with("/tmp/a", "/tmp/b")
+        fs.executor.assert_not_called()
+
+    def test_rename_falls_back_to_mv(self):
+        fs, client = self.make_filesystem()
+        client.rename.side_effect = http_error(404)
+        fs.rename_file("/tmp/a", "/tmp/my file")
+        self.assertIn("rename", fs.sandbox._unsupported_endpoints)
+        fs.executor.assert_called_once_with("mv /tmp/a '/tmp/my file'")
+
+        # Later calls skip the probe
+        fs.move_file("/tmp/c", "/tmp/d")
+        client.rename.assert_called_once()
+        fs.executor.assert_called_with("mv /tmp/c /tmp/d")
+
+    def test_rename_not_found(self):
+        fs, client = self.make_filesystem()
+        client.rename.side_effect = http_error(
+            404, {"error": "rename /tmp/a: no such file or directory"}
+        )
+        with self.assertRaises(SandboxFileNotFoundError):
+            fs.rename_file("/tmp/a", "/tmp/b")
+        self.assertNotIn("rename", fs.sandbox._unsupported_endpoints)
+        fs.executor.assert_not_called()
+
+    def test_rm_uses_endpoint(self):
+        fs, client = self.make_filesystem()
+        fs.rm("/tmp/dir", recursive=True)
+        client.remove.assert_called_once_with("/tmp/dir", True)
+        fs.executor.assert_not_called()
+
+    def test_rm_falls_back_to_shell(self):
+        fs, client = self.make_filesystem()
+        client.remove.side_effect = http_error(404)
+        fs.rm("/tmp/dir", recursive=True)
+        self.assertIn("remove", fs.sandbox._unsupported_endpoints)
+        fs.executor.assert_called_once_with("rm -rf /tmp/dir")
+
+        # Later calls skip the probe
+        fs.rm("/tmp/file")
+        client.remove.assert_called_once()
+        fs.executor.assert_called_with("rm /tmp/file")
+
+    def test_rm_not_found(self):
+        fs, client = self.make_filesystem()
+        client.remove.side_effect = http_error(
+            404, {"error": "remove /tmp/file: no such file or directory"}
+        )
+        with self.assertRaises(SandboxFileNotFoundError):
+            fs.rm("/tmp/file")
+        self.assertNotIn("remove", fs.sandbox._unsupported_endpoints)
+        fs.executor.assert_not_called()
+
+
+class TestWriteFilesBatch(unittest.TestCase):
+    """Tests for write_files on executors with the batch endpoint."""
+
+    FILES = [
+        {"path": "/tmp/a.txt", "content": "a"},
+        {"path": "/tmp/b.bin", "content": b"\x00\x01", "encoding": "base64"},
+    ]
+
+    def test_single_request(self):
+        fs, client = make_filesystem()
+        client.write_files.return_value = {"success": True}
+        fs.write_files(self.FILES)
+        client.write_files.assert_called_once_with(
+            [
+                {"path": "/tmp/a.txt", "content": "a"},
+                {"path": "/tmp/b.bin", "content": "AAE="},
+            ]
+        )
+        client.write_file.assert_not_called()
+
+    def test_per_entry_errors_are_raised(self):
+        fs, client = make_filesystem()
+        client.write_files.return_value = {
+            "errors": [{"path": "/tmp/b.bin", "error": "permission denied"}]
+        }
+        with self.assertRaisesRegex(
+            SandboxFilesystemError, "/tmp/b.bin: permission denied"
+        ):
+            fs.write_files(self.FILES)
+
+    def test_falls_back_when_endpoint_is_unsupported(self):
+        for status_code in (404, 405, 501):
+            fs, client = make_filesystem()
+            client.write_files.side_effect = http_error(status_code)
+            fs.write_files(self.FILES)
+            self.assertIn("write_files", fs.sandbox._unsupported_endpoints)
+            self.assertEqual(client.write_file.call_count, 2)
+
+            # Later calls go straight to the fallback
+            fs.write_files(self.FILES)
+            client.write_files.assert_called_once()
+            self.assertEqual(client.write_file.call_count, 4)
+
+    def test_executor_errors_do_not_fall_back(self):
+        fs, client = make_filesystem()
+        client.write_files.side_effect = http_error(400, {"error": "invalid path"})
+        with self.assertRaisesRegex(SandboxFilesystemError, "invalid path"):
+            fs.write_files(self.FILES)
+        self.assertNotIn("write_files", fs.sandbox._unsupported_endpoints)
+        client.write_file.assert_not_called()
+
+
+class TestWriteFilesFallback(unittest.TestCase):
+    """Tests for write_files on executors without the batch endpoint."""
+
+    FILES = [
+        {"path": "/tmp/cfg", "content": "first"},
+        {"path": "/tmp/other", "content": "other"},
+        {"path": "/tmp/cfg", "content": "second"},
+    ]
+
+    def test_last_write_wins_for_duplicate_paths(self):
+        fs, client = make_filesystem()
+        fs.sandbox._unsupported_endpoints.add("write_files")
+        disk = {}
+
+        def write_file(path, content):
+            # Make the first write slow so a concurrent second write would win the race
+            if content == "first":
+                time.sleep(0.05)
+            disk[path] = content
+            return {"success": True}
+
+        client.write_file.side_effect = write_file
+        fs.write_files(self.FILES)
+        self.assertEqual(disk, {"/tmp/cfg": "second", "/tmp/other": "other"})
+
+    def test_failure_does_not_stop_other_writes(self):
+        fs, client = make_filesystem()
+        fs.sandbox._unsupported_endpoints.add("write_files")
+        disk = {}
+
+        def write_file(path, content):
+            if path == "/tmp/other":
+                return {"error": "disk full"}
+            disk[path] = content
+            return {"success": True}
+
+        client.write_file.side_effect = write_file
+        with self.assertRaises(SandboxFilesystemError):
+            fs.write_files(self.FILES)
+        self.assertEqual(disk, {"/tmp/cfg": "second"})
+
+    def test_async_last_write_wins_for_duplicate_paths(self):
+        sandbox = mock.Mock()
+        sandbox._unsupported_endpoints = {"write_files"}
+        sandbox._stat_cache = PathCache(ttl=10)
+        sandbox._list_dir_cache = PathCache(ttl=10)
+        disk = {}
+
+        async def write_file(path, content):
+            if content == "first":
+                await asyncio.sleep(0.05)
+            disk[path] = content
+            return {"success": True}
+
+        sandbox._get_async_client.return_value.write_file = write_file
+        asyncio.run(AsyncSandboxFilesystem(sandbox).write_files(self.FILES))
+        self.assertEqual(disk, {"/tmp/cfg": "second", "/tmp/other": "other"})
+
+
+class TestAppendMode(unittest.TestCase):
+    """Tests for file handles opened in append mode."""
+
+    def test_reads_file_once_without_append_endpoint(self):
+        fs, client = make_filesystem()
+        fs.sandbox._unsupported_endpoints.add("append_file")
+        client.read_file.return_value = {"content": "start\n"}
+        f = fs.open("/tmp/log", "a")
+        f.write("one\n")
+        f.write("two\n")
+        client.read_file.assert_called_once_with("/tmp/log")
+        self.assertEqual(
+            client.write_file.call_args_list,
+            [
+                mock.call("/tmp/log", "start\none\n"),
+                mock.call("/tmp/log", "start\none\ntwo\n"),
+            ],
+        )
+
+        f.close()
+        self.assertIsNone(f._cached_content)
+
+    def test_server_side_append_does_not_cache(self):
+        fs, client = make_filesystem()
+        client.append_file.return_value = {"success": True}
+        with fs.open("/tmp/log", "a") as f:
+            f.write("one\n")
+            self.assertIsNone(f._cached_content)
+        client.append_file.assert_called_once_with("/tmp/log", "one\n")
+        client.read_file.assert_not_called()
+
+    def test_async_reads_file_once_without_append_endpoint(self):
+        sandbox = mock.Mock()
+        sandbox._unsupported_endpoints = {"append_file"}
+        sandbox._stat_cache = PathCache(ttl=10)
+        sandbox._list_dir_cache = PathCache(ttl=10)
+        client = sandbox._get_async_client.return_value = mock.AsyncMock()
+        client.read_file.return_value = {"content": "start\n"}
+        client.write_file.return_value = {"success": True}
+
+        async def append():
+            f = AsyncSandboxFilesystem(sandbox).open("/tmp/log", "a")
+            await f.write("one\n")
+            await f.write("two\n")
+            f.close()
+            return f
+
+        f = asyncio.run(append())
+        client.read_file.assert_called_once_with("/tmp/log")
+        client.write_file.assert_called_with("/tmp/log", "start\none\ntwo\n")
+        self.assertIsNone(f._cached_content)
+
+
+if __name__ == "__main__":
+    unittest.main()
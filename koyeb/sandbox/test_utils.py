@@ -1,6 +1,14 @@
+import subprocess
+import sys
 import unittest
+from unittest import mock
 
-from koyeb.sandbox.utils import create_docker_source
+from koyeb.sandbox.utils import (
+    PathCache,
+    check_error_message,
+    classify_error,
+    create_docker_source,
+)
 
 
 class TestCreateDockerSource(unittest.TestCase):
@@ -60,5 +68,124 @@ class TestCreateDockerSource(unittest.TestCase):
         self.assertEqual(ds.command, "serve")
 
 
+class TestPathCache(unittest.TestCase):
+    """Tests for the TTL path cache used by the sandbox filesystem."""
+
+    def test_get_set(self):
+        cache = PathCache(ttl=10)
+        self.assertIsNone(cache.get("/tmp/a"))
+        cache.set("/tmp/a", {"exists": True})
+        self.assertEqual(cache.get("/tmp/a"), {"exists": True})
+
+    def test_paths_are_normalized(self):
+        cache = PathCache(ttl=10)
+        cache.set("/tmp/dir/", ["a"])
+        self.assertEqual(cache.get("/tmp/./dir"), ["a"])
+
+    def test_expiry(self):
+        cache = PathCache(ttl=2)
+        with mock.patch("koyeb.sandbox.utils.time.monotonic", return_value=100.0):
+            cache.set("/tmp/a", "value")
+        with mock.patch("koyeb.sandbox.utils.time.monotonic", return_value=101.0):
+            self.assertEqual(cache.get("/tmp/a"), "value")
+        with mock.patch("koyeb.sandbox.utils.time.monotonic", return_value=102.0):
+            self.assertIsNone(cache.get("/tmp/a"))
+
+    def test_zero_ttl_disables_cache(self):
+        cache = PathCache(ttl=0)
+        cache.set("/tmp/a", "value")
+        self.assertIsNone(cache.get("/tmp/a"))
+
+    def test_invalidate_drops_descendants(self):
+        cache = PathCache(ttl=10)
+        cache.set("/tmp/dir", "dir")
+        cache.set("/tmp/dir/file", "file")
+        cache.set("/tmp/dirty", "other")
+        cache.invalidate("/tmp/dir")
+        self.assertIsNone(cache.get("/tmp/dir"))
+        self.assertIsNone(cache.get("/tmp/dir/file"))
+        self.assertEqual(cache.get("/tmp/dirty"), "other")
+
+    def test_invalidate_non_recursive(self):
+        cache = PathCache(ttl=10)
+        cache.set("/tmp/dir", "dir")
+        cache.set("/tmp/dir/sub", "sub")
+        cache.invalidate("/tmp/dir", recursive=False)
+        self.assertIsNone(cache.get("/tmp/dir"))
+        self.assertEqual(cache.get("/tmp/dir/sub"), "sub")
+
+    def test_set_prunes_expired_entries(self):
+        cache = PathCache(ttl=2)
+        with mock.patch("koyeb.sandbox.utils.time.monotonic", return_value=100.0):
+            for i in range(100):
+                cache.set(f"/tmp/file{i}", i)
+        with mock.patch("koyeb.sandbox.utils.time.monotonic", return_value=103.0):
+            cache.set("/tmp/new", "new")
+        self.assertEqual(len(cache._entries), 1)
+
+
+class TestClassifyError(unittest.TestCase):
+    """Tests for classify_error and check_error_message."""
+
+    def test_known_errors(self):
+        self.assertEqual(
+            classify_error("open /tmp/x: no such file or directory"), "NO_SUCH_FILE"
+        )
+        self.assertEqual(classify_error("mkdir /tmp/x: file exists"), "FILE_EXISTS")
+        self.assertEqual(
+            classify_error("remove /tmp/x: Directory not empty"), "DIR_NOT_EMPTY"
+        )
+
+    def test_case_insensitive(self):
+        self.assertEqual(classify_error("PATH NOT FOUND"), "NO_SUCH_FILE")
+
+    def test_unknown_error(self):
+        self.assertIsNone(classify_error("permission denied"))
+        self.assertIsNone(classify_error(""))
+
+    def test_error_types_take_precedence_over_position(self):
+        msg = "open /tmp/exists_check/a.txt: no such file or directory"
+        self.assertEqual(classify_error(msg), "FILE_EXISTS")
+        self.assertEqual(classify_error(msg, ["NO_SUCH_FILE"]), "NO_SUCH_FILE")
+        self.assertEqual(
+            classify_error(msg, ["FILE_EXISTS", "NO_SUCH_FILE"]), "FILE_EXISTS"
+        )
+        self.assertIsNone(classify_error(msg, ["DIR_NOT_EMPTY"]))
+
+    def test_agrees_with_check_error_message(self):
+        for msg in ("no such file", "already exists", "not empty", "boom"):
+            tag = classify_error(msg)
+            if tag is not None:
+                self.assertTrue(check_error_message(msg, tag))
+            for error_type in ("NO_SUCH_FILE", "FILE_EXISTS", "DIR_NOT_EMPTY"):
+                if error_type != tag:
+                    self.assertFalse(check_error_message(msg, error_type))
+
+
+class TestPackageExports(unittest.TestCase):
+    """Tests for the attributes the koyeb package loads on first access."""
+
+    def run_fresh(self, code):
+        # A new interpreter, so nothing is imported yet
+        return subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+    def test_sandbox_and_submodules_resolve(self):
+        for attr in ("Sandbox", "api.Configuration", "api_async.Configuration"):
+            result = self.run_fresh(f"import koyeb; koyeb.{attr}")
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_unknown_attribute(self):
+        result = self.run_fresh("import koyeb; koyeb.missing")
+        self.assertIn("AttributeError", result.stderr)
+
+    def test_dir_lists_lazy_attributes(self):
+        import koyeb
+
+        for name in ("Sandbox", "Secret", "api", "api_async", "sandbox"):
+            self.assertIn(name, dir(koyeb))
+
+
 if __name__ == "__main__":
     unittest.main()
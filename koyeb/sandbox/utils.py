@@ -6,9 +6,13 @@ Utility functions for Koyeb Sandbox
 
 import logging
 import os
+import posixpath
+import re
 import shlex
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from koyeb.api import ApiClient, Configuration
 from koyeb.api.api import (
@@ -47,6 +51,13 @@ DEFAULT_INSTANCE_WAIT_TIMEOUT = 60  # seconds
 DEFAULT_POLL_INTERVAL = 0.5  # seconds
 DEFAULT_COMMAND_TIMEOUT = 30  # seconds
 DEFAULT_HTTP_TIMEOUT = 30  # seconds for HTTP requests
+DEFAULT_HTTP_MAX_CONNECTIONS = 64
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 300  # seconds an idle connection is kept open
+DEFAULT_FS_CACHE_TTL = 2.0  # seconds filesystem metadata stays cached
+FILE_TRANSFER_CHUNK_SIZE = 1024 * 1024  # bytes per chunk when streaming files
+MAX_CONCURRENT_FILE_WRITES = 16  # parallel requests when writing files one by one
+ESCAPE_CACHE_MAX_ARG_LENGTH = 4096  # longer shell arguments bypass the cache
 
 # Error messages
 ERROR_MESSAGES = {
@@ -55,6 +66,15 @@ ERROR_MESSAGES = {
     "DIR_NOT_EMPTY": ["not empty", "Directory not empty"],
 }
 
+# Single pattern with one named group per error type, matching any of its messages
+_ERROR_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{error_type}>{'|'.join(re.escape(pattern) for pattern in patterns)})"
+        for error_type, patterns in ERROR_MESSAGES.items()
+    ),
+    re.IGNORECASE,
+)
+
 # Valid protocols for DeploymentPort (from OpenAPI spec: http, http2, tcp)
 # For sandboxes, we only support http and http2
 VALID_DEPLOYMENT_PORT_PROTOCOLS = ("http", "http2")
@@ -513,9 +533,81 @@ def escape_shell_arg(arg: str) -> str:
     Returns:
         Properly escaped shell argument
     """
+    if len(arg) > ESCAPE_CACHE_MAX_ARG_LENGTH:
+        return shlex.quote(arg)
+    return _cached_shell_quote(arg)
+
+
+@lru_cache(maxsize=1024)
+def _cached_shell_quote(arg: str) -> str:
     return shlex.quote(arg)
 
 
+class PathCache:
+    """
+    Small TTL cache for filesystem metadata, keyed by sandbox path.
+
+    Entries expire after `ttl` seconds (monotonic clock). A ttl of 0 disables
+    caching. Invalidating a path also drops every cached entry below it.
+    Expired entries are pruned at most once per ttl when new entries are set,
+    so caching many distinct paths does not grow the cache without bound.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_FS_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._next_prune = 0.0
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return posixpath.normpath(path)
+
+    def get(self, path: str) -> Optional[Any]:
+        """Return the cached value for path, or None if missing or expired."""
+        key = self._key(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, path: str, value: Any) -> None:
+        """Cache value for path."""
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._prune(now)
+            self._next_prune = now + self.ttl
+        self._entries[self._key(path)] = (now + self.ttl, value)
+
+    def _prune(self, now: float) -> None:
+        """Drop every expired entry."""
+        # Iterate over a snapshot, other threads may update the cache meanwhile
+        for key, (expires_at, _) in list(self._entries.items()):
+            if expires_at <= now:
+                self._entries.pop(key, None)
+
+    def invalidate(self, path: str, recursive: bool = True) -> None:
+        """Drop the cached entry for path and, if recursive, everything below it."""
+        key = self._key(path)
+        if not recursive:
+            self._entries.pop(key, None)
+            return
+        prefix = key if key.endswith("/") else key + "/"
+        # Iterate over a snapshot, other threads may update the cache meanwhile
+        for cached in list(self._entries):
+            if cached == key or cached.startswith(prefix):
+                self._entries.pop(cached, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
 def validate_port(port: int) -> None:
     """
     Validate that a port number is in the valid range.
@@ -552,6 +644,30 @@ def check_error_message(error_msg: str, error_type: str) -> bool:
     return any(pattern.lower() in error_msg_lower for pattern in patterns)
 
 
+def classify_error(
+    error_msg: str, error_types: Optional[Iterable[str]] = None
+) -> Optional[str]:
+    """
+    Find the error type of an error message in a single scan.
+
+    Args:
+        error_msg: The error message to classify
+        error_types: Error types to look for, in order of precedence (default:
+            all of them, the first one found in the message wins)
+
+    Returns:
+        The key in ERROR_MESSAGES of the matching error type, or None if no
+        known pattern matches
+    """
+    if error_types is None:
+        match = _ERROR_PATTERN.search(error_msg)
+        return match.lastgroup if match else None
+
+    # Paths in the message may contain patterns of other error types
+    found = {match.lastgroup for match in _ERROR_PATTERN.finditer(error_msg)}
+    return next((error_type for error_type in error_types if error_type in found), None)
+
+
 def create_sandbox_client(
     conn_info: Optional['ConnectionInfo'],
     existing_client: Optional[Any] = None,